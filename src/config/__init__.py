@@ -6,4 +6,5 @@ and other components of the Toronto Auto Theft Analysis project.
 Modules:
     etl_config: Configuration settings for the ETL pipeline
     logging_config: Configuration for logging
+    paths: Project root directory resolution
 """
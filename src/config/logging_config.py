@@ -4,13 +4,14 @@ This module contains the logging configuration for the ETL pipeline,
 including log format, handlers, and level settings.
 """
 
+import functools
 import logging
 import sys
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from multiprocessing.queues import Queue
+
+from src.config.paths import ROOT_DIR
 
-# Get the root directory
-ROOT_DIR = Path(__file__).parents[2].absolute()
 LOG_DIR = ROOT_DIR / "logs"
 
 # Create logs directory if it doesn't exist
@@ -53,9 +54,45 @@ LOGGING_CONFIG = {
 }
 
 
+# Handler sending the records of a worker process to the parent process,
+# set by log_to_queue
+_queue_handler: QueueHandler | None = None
+
+
+@functools.cache
+def _handlers() -> tuple[logging.Handler, ...]:
+    """Console and log file handlers shared by all loggers of the process.
+
+    A single file handler per process keeps log file rotation consistent.
+
+    Returns:
+        Tuple of (console_handler, file_handler)
+    """
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter("%(levelname)s - %(message)s"))
+
+    file_handler = RotatingFileHandler(
+        filename=str(ETL_LOG_FILE),
+        maxBytes=10485760,  # 10 MB
+        backupCount=5,
+        delay=True,  # Worker processes never open the log file
+    )
+
+    file_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    file_handler.setLevel(logging.DEBUG)
+
+    return console_handler, file_handler
+
+
+@functools.cache
 def get_logger(name: str) -> logging.Logger:
     """Get a configured logger.
 
+    Results are cached, so repeated calls with the same name return the
+    already-configured logger without rebuilding its handlers.
+
     Args:
         name: The name of the logger.
 
@@ -66,25 +103,42 @@ def get_logger(name: str) -> logging.Logger:
 
     # Configure logger if it doesn't have handlers yet
     if not logger.handlers:
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(logging.Formatter("%(levelname)s - %(message)s"))
-        # Make sure log directory exists
-        LOG_DIR.mkdir(exist_ok=True)
-
-        file_handler = RotatingFileHandler(
-            filename=str(ETL_LOG_FILE),
-            maxBytes=10485760,  # 10 MB
-            backupCount=5,
-        )
-
-        file_handler.setFormatter(
-            logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        )
-        file_handler.setLevel(logging.DEBUG)
-
-        logger.addHandler(console_handler)
-        logger.addHandler(file_handler)
+        for handler in (_queue_handler,) if _queue_handler else _handlers():
+            logger.addHandler(handler)
+
         logger.setLevel(logging.DEBUG)
         logger.propagate = False
 
     return logger
+
+
+def log_to_queue(queue: Queue) -> None:
+    """Send the records of all configured loggers to a queue.
+
+    Used in worker processes, so that only the listener of the parent
+    process writes to the console and the log file.
+
+    Args:
+        queue: Multiprocessing queue read by a log_listener
+    """
+    global _queue_handler
+    _queue_handler = QueueHandler(queue)
+
+    handlers = _handlers()
+    for logger in logging.Logger.manager.loggerDict.values():
+        if isinstance(logger, logging.Logger) and logger.handlers == list(handlers):
+            logger.handlers = [_queue_handler]
+
+
+def log_listener(queue: Queue) -> QueueListener:
+    """Build a listener writing the records of worker processes.
+
+    The records are written with the handlers of the calling process.
+
+    Args:
+        queue: Multiprocessing queue the worker processes log to
+
+    Returns:
+        Listener to start before and stop after the worker processes run
+    """
+    return QueueListener(queue, *_handlers(), respect_handler_level=True)
@@ -0,0 +1,21 @@
+"""Project path settings.
+
+This module resolves the project root directory once, so that configuration
+modules and utilities can share it without recomputing it.
+"""
+
+import functools
+from pathlib import Path
+
+
+@functools.cache
+def project_root() -> Path:
+    """Get the absolute path of the project root directory.
+
+    Returns:
+        Resolved path of the project root directory
+    """
+    return Path(__file__).resolve().parents[2]
+
+
+ROOT_DIR = project_root()
@@ -1,8 +1,8 @@
 """ETL package for Toronto Auto Theft Analysis.
 
 This package contains modules for extracting, transforming, and loading
-Toronto auto theft data. It follows a modular approach with separate
-components for each stage of the ETL process.
+Toronto auto theft, Canada Census 2021 and geospatial data. It follows a
+modular approach with separate components for each stage of the ETL process.
 
 Modules:
     extractors: Data extraction from raw sources
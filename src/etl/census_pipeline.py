@@ -7,19 +7,18 @@ This module orchestrates the ETL process for Canada Census 2021 data:
 """
 
 import argparse
-import sys
+import logging
+from collections import ChainMap
+from collections.abc import Mapping
 from pathlib import Path
+from typing import Any
 
-# Add the project root to Python path to enable absolute imports
-project_root = Path(__file__).parents[2].absolute()
-sys.path.append(str(project_root))
-
-from src.config.etl_config import CENSUS_CONFIG  # noqa: E402
-from src.config.logging_config import get_logger  # noqa: E402
-from src.etl.extractors.census_extractor import CensusExtractor  # noqa: E402
-from src.etl.loaders.census_loader import CensusLoader  # noqa: E402
-from src.etl.transformers.census_transformer import CensusTransformer  # noqa: E402
-from src.utils.etl_metrics import ETLMetrics  # noqa: E402
+from src.config.etl_config import CENSUS_CONFIG
+from src.config.logging_config import get_logger
+from src.etl.extractors.census_extractor import CensusExtractor
+from src.etl.loaders.census_loader import CensusLoader
+from src.etl.transformers.census_transformer import CensusTransformer
+from src.utils.etl_metrics import ETLMetrics
 
 logger = get_logger("etl.census_pipeline")
 
@@ -31,7 +30,7 @@ class CensusPipeline:
     extraction, transformation, and loading steps.
     """
 
-    def __init__(self, config: dict | None = None):
+    def __init__(self, config: Mapping[str, Any] | None = None):
         """Initialize the pipeline with configuration.
 
         Args:
@@ -44,13 +43,17 @@ class CensusPipeline:
 
         logger.info("CensusPipeline initialized")
 
-    def run(self) -> None:
+    def run(self, metrics: ETLMetrics | None = None) -> None:
         """Run the complete ETL pipeline.
 
         Executes extraction, transformation, and loading steps sequentially,
         with timing and logging for each step.
+
+        Args:
+            metrics: Metrics collector to record into, e.g. to share one across
+                repeated runs (default: a new collector for this run)
         """
-        metrics = ETLMetrics("census_data")
+        metrics = metrics or ETLMetrics("census_data")
         logger.info("Starting census data ETL pipeline")
 
         try:
@@ -58,45 +61,42 @@ class CensusPipeline:
             metrics.start_stage("extract")
             raw_data = self.extractor.extract_data()
             extract_duration = metrics.end_stage("extract")
-            metrics.record_row_count("extract", len(raw_data))
-            metrics.record_memory_usage(
-                "extract", raw_data.memory_usage(deep=True).sum() / 1e6
-            )
-            logger.info(f"Data extraction completed in {extract_duration:.2f} seconds")
+            metrics.record_row_count("extract", raw_data.num_rows)
+            metrics.record_memory_usage("extract", raw_data)
+            logger.info("Data extraction completed in %.2f seconds", extract_duration)
 
             # Transform data
             metrics.start_stage("transform")
             transformed_data = self.transformer.transform_data(raw_data)
             transform_duration = metrics.end_stage("transform")
-            metrics.record_row_count("transform", len(transformed_data))
-            metrics.record_memory_usage(
-                "transform", transformed_data.memory_usage(deep=True).sum() / 1e6
-            )
+            metrics.record_row_count("transform", transformed_data.num_rows)
+            metrics.record_memory_usage("transform", transformed_data)
             logger.info(
-                f"Data transformation completed in {transform_duration:.2f} seconds"
+                "Data transformation completed in %.2f seconds", transform_duration
             )
 
             # Load data
             metrics.start_stage("load")
             self.loader.load_data(transformed_data)
             load_duration = metrics.end_stage("load")
-            metrics.record_row_count("final", len(transformed_data))
-            logger.info(f"Data loading completed in {load_duration:.2f} seconds")
+            metrics.record_row_count("final", transformed_data.num_rows)
+            logger.info("Data loading completed in %.2f seconds", load_duration)
 
             # Finalize and save metrics
             metrics.finalize()
             metrics_file = metrics.save()
 
             logger.info(
-                f"Pipeline completed successfully in "
-                f"{metrics.metrics['total_duration']:.2f} seconds"
+                "Pipeline completed successfully in %.2f seconds",
+                metrics.metrics["total_duration"],
             )
-            logger.info(f"Metrics saved to {metrics_file}")
-            logger.info("\n" + metrics.summary())
+            logger.info("Metrics saved to %s", metrics_file)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("\n%s", metrics.summary())
 
         except Exception as e:
             metrics.save("failed")
-            logger.exception(f"Pipeline failed: {e}")
+            logger.exception("Pipeline failed: %s", e)
             raise
 
 
@@ -121,6 +121,11 @@ def parse_args():
         type=int,
         help="Maximum characteristic hierarchy level to include (overrides default)",
     )
+    parser.add_argument(
+        "--use-cache",
+        action="store_true",
+        help="Reuse a cached parquet copy of the raw data if it is up to date",
+    )
     return parser.parse_args()
 
 
@@ -128,23 +133,26 @@ def main():
     """Main entry point for the ETL pipeline."""
     args = parse_args()
 
-    # Create custom config with any overridden paths
-    config = CENSUS_CONFIG.copy()
+    # Layer the command line overrides over the default config
+    overrides = {}
 
     if args.geo_input:
-        config["geo_input_path"] = Path(args.geo_input)
+        overrides["geo_input_path"] = Path(args.geo_input)
 
     if args.data_input:
-        config["data_input_path"] = Path(args.data_input)
+        overrides["data_input_path"] = Path(args.data_input)
 
     if args.output:
-        config["output_path"] = Path(args.output)
+        overrides["output_path"] = Path(args.output)
 
     if args.max_level:
-        config["max_characteristic_level"] = args.max_level
+        overrides["max_characteristic_level"] = args.max_level
+
+    if args.use_cache:
+        overrides["use_cache"] = True
 
     # Run the pipeline
-    pipeline = CensusPipeline(config)
+    pipeline = CensusPipeline(ChainMap(overrides, CENSUS_CONFIG))
     pipeline.run()
 
 
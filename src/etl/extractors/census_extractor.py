@@ -1,15 +1,31 @@
 """Data extraction module for Canada Census 2021 data."""
 
-import os
+import csv
+import itertools
+import re
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Any
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pa_csv
 
 from src.config.etl_config import CENSUS_CONFIG
 from src.config.logging_config import get_logger
+from src.utils.arrow_utils import arrow_schema_from, encode_categories
 from src.utils.error_handling import retry
+from src.utils.parquet_cache import cache_paths, read_cache, source_stamp, write_cache
 
 logger = get_logger(__name__)
 
+# Streamed reads parse one block at a time, so rows after Toronto are not read
+CSV_BLOCK_SIZE = 8 << 20  # 8 MB
+# Count and rate data columns, e.g. C1_COUNT_TOTAL or C10_RATE_TOTAL
+DATA_COLUMN_PATTERN = re.compile(r"C\d+_(COUNT|RATE)")
+# Settings that shape the extracted data, so changing them invalidates the cache
+CACHE_SETTINGS = ("column_dtypes", "columns_to_drop", "fsa_prefix", "encoding")
+
 
 class CensusExtractor:
     """Extractor class for Canada Census 2021 data.
@@ -20,7 +36,7 @@ class CensusExtractor:
     to determine which rows to extract from the main census file.
     """
 
-    def __init__(self, config: dict | None = None):
+    def __init__(self, config: Mapping[str, Any] | None = None):
         """Initialize the extractor with configuration.
 
         Args:
@@ -31,13 +47,15 @@ class CensusExtractor:
         self.data_input_path = self.config["data_input_path"]
         self.fsa_prefix = self.config["fsa_prefix"]
         self.encoding = self.config["encoding"]
+        self.use_cache = self.config["use_cache"]
 
         logger.info(
-            f"CensusExtractor initialized with paths: {self.geo_input_path}, "
-            f"{self.data_input_path}"
+            "CensusExtractor initialized with paths: %s, %s",
+            self.geo_input_path,
+            self.data_input_path,
         )
 
-    @retry((IOError, pd.errors.EmptyDataError), tries=3, delay=2.0)
+    @retry((IOError, pa.ArrowInvalid), tries=3, delay=2.0)
     def calculate_row_indices(self) -> tuple[int, int]:
         """Calculate the skiprows and nrows parameters for census data extraction.
 
@@ -52,155 +70,287 @@ class CensusExtractor:
         Raises:
             FileNotFoundError: If the geographic index file doesn't exist
             IOError: If there's an error reading the file
-            pd.errors.EmptyDataError: If the file is empty
+            pa.ArrowInvalid: If the file is empty or cannot be parsed
         """
-        logger.info(f"Calculating row indices from {self.geo_input_path}")
+        logger.info("Calculating row indices from %s", self.geo_input_path)
 
         # Default values in case we can't calculate proper ones
         default_skiprows = 0
         default_nrows = 1000000  # Large enough to get all data
 
-        if not os.path.exists(self.geo_input_path):
-            logger.error(f"Geographic index file not found: {self.geo_input_path}")
-            logger.warning("Using default row indices")
-            return default_skiprows, default_nrows
-
         try:
-            # Read the geographic index file
-            df_geo = pd.read_csv(self.geo_input_path)
-
-            # Find rows where Geo Name starts with the FSA prefix
-            toronto_mask = df_geo["Geo Name"].str.startswith(self.fsa_prefix)
-
-            if not toronto_mask.any():
-                logger.warning(f"No FSAs found with prefix '{self.fsa_prefix}'")
+            next_fsa_group_char = chr(ord(self.fsa_prefix[0]) + 1)
+            toronto_bounds, next_fsa_starts = [], []
+
+            # Only the two columns needed to locate the FSA rows are streamed,
+            # keeping the line number bounds of each batch
+            with pa_csv.open_csv(
+                self.geo_input_path,
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=["Geo Name", "Line Number"]
+                ),
+            ) as reader:
+                for batch in reader:
+                    geo_names = batch.column("Geo Name")
+                    line_numbers = batch.column("Line Number")
+
+                    # Rows where Geo Name starts with the FSA prefix
+                    toronto_lines = pc.filter(
+                        line_numbers, pc.starts_with(geo_names, self.fsa_prefix)
+                    )
+                    if len(toronto_lines) > 0:
+                        bounds = pc.min_max(toronto_lines)
+                        toronto_bounds.append(bounds["min"].as_py())
+                        toronto_bounds.append(bounds["max"].as_py())
+
+                    # Rows where Geo Name starts with the next character
+                    next_fsa_lines = pc.filter(
+                        line_numbers, pc.starts_with(geo_names, next_fsa_group_char)
+                    )
+                    if len(next_fsa_lines) > 0:
+                        next_fsa_starts.append(pc.min(next_fsa_lines).as_py())
+
+            if not toronto_bounds:
+                logger.warning("No FSAs found with prefix '%s'", self.fsa_prefix)
                 logger.warning("Using default row indices")
                 return default_skiprows, default_nrows
 
             # Find the start line (first Toronto FSA)
-            start_line = df_geo[toronto_mask]["Line Number"].min()
-
-            # Find the end line (first FSA after Toronto)
-            next_fsa_group_char = chr(ord(self.fsa_prefix[0]) + 1)
-            next_fsa_mask = df_geo["Geo Name"].str.startswith(next_fsa_group_char)
+            start_line = min(toronto_bounds)
 
-            if next_fsa_mask.any():
-                # Get the first line number where Geo Name starts with next character
-                end_line = df_geo[next_fsa_mask]["Line Number"].min()
+            # Find the end line (first FSA after Toronto), or if there are no
+            # FSAs after Toronto, use the max line number + 1
+            if next_fsa_starts:
+                end_line = min(next_fsa_starts)
             else:
-                # If no FSAs after Toronto, use the max line number + 1
-                end_line = df_geo[toronto_mask]["Line Number"].max() + 1
+                end_line = max(toronto_bounds) + 1
 
             # Calculate skiprows and nrows
             nskiprows = start_line - 1  # skip header and lines before Toronto
             nrows = end_line - start_line  # number of Toronto rows
 
             logger.info(
-                f"Row indices: start={start_line}, end={end_line}, "
-                f"skiprows={nskiprows}, nrows={nrows}"
+                "Row indices: start=%d, end=%d, skiprows=%d, nrows=%d",
+                start_line,
+                end_line,
+                nskiprows,
+                nrows,
             )
 
             return nskiprows, nrows
 
-        except pd.errors.EmptyDataError:
-            logger.error(f"Empty geographic index file: {self.geo_input_path}")
+        except FileNotFoundError:
+            logger.error("Geographic index file not found: %s", self.geo_input_path)
+            logger.warning("Using default row indices")
+            return default_skiprows, default_nrows
+        except pa.ArrowInvalid as e:
+            logger.error(
+                "Invalid or empty geographic index file %s: %s", self.geo_input_path, e
+            )
             logger.warning("Using default row indices")
             return default_skiprows, default_nrows
         except OSError as e:
-            logger.error(f"IOError while reading {self.geo_input_path}: {e}")
+            logger.error("IOError while reading %s: %s", self.geo_input_path, e)
             logger.warning("Using default row indices")
             return default_skiprows, default_nrows
         except Exception as e:
-            logger.exception(f"Unexpected error while calculating row indices: {e}")
+            logger.exception("Unexpected error while calculating row indices: %s", e)
             logger.warning("Using default row indices")
             return default_skiprows, default_nrows
 
-    @retry((IOError, pd.errors.EmptyDataError), tries=3, delay=2.0)
-    def extract_census_data(self, nskiprows: int, nrows: int) -> pd.DataFrame:
+    @cached_property
+    def census_columns(self) -> tuple[list[str], dict[str, str]]:
+        """Column names and dtypes of the census data file.
+
+        SYMBOL columns are renamed to associate them with their data columns.
+
+        Returns:
+            Tuple of (column_names, column_dtypes) to read the census file with
+
+        Raises:
+            FileNotFoundError: If the census data file doesn't exist
+        """
+        # Only the header line is needed, so the file is read without pandas
+        with open(self.data_input_path, newline="", encoding=self.encoding) as f:
+            original_columns = next(csv.reader(f), [])
+
+        column_dtypes = dict(self.config["column_dtypes"])
+
+        # Rename the n-th SYMBOL column to Cn_SYMBOL to associate it with its
+        # data column
+        symbol_index = itertools.count(1)
+        new_columns = [
+            f"C{next(symbol_index)}_SYMBOL" if col == "SYMBOL" else col
+            for col in original_columns
+        ]
+        for col in new_columns:
+            if col.endswith("_SYMBOL"):
+                column_dtypes[col] = "category"
+
+        return new_columns, column_dtypes
+
+    @cached_property
+    def census_read_columns(
+        self,
+    ) -> tuple[list[str], list[str], dict[str, pa.DataType]]:
+        """Columns and Arrow types to read from the census data file.
+
+        Categorical columns are read as strings, since they are only encoded
+        once the Toronto rows have been extracted. Count and rate data columns
+        are read as floats, since a streamed read infers the type of other
+        columns from the first block only.
+
+        Returns:
+            Tuple of (include_columns, category_columns, column_types)
+        """
+        new_columns, column_dtypes = self.census_columns
+        columns_to_drop = set(self.config["columns_to_drop"])
+        include_columns = [col for col in new_columns if col not in columns_to_drop]
+
+        categories = [
+            col for col in include_columns if column_dtypes.get(col) == "category"
+        ]
+        column_types = {
+            **arrow_schema_from(column_dtypes),
+            **{
+                col: pa.float64()
+                for col in include_columns
+                if DATA_COLUMN_PATTERN.match(col)
+            },
+            **{col: pa.string() for col in categories},
+        }
+        return include_columns, categories, column_types
+
+    @retry((IOError, pa.ArrowInvalid), tries=3, delay=2.0)
+    def extract_census_data(self, nskiprows: int, nrows: int) -> pa.Table:
         """Extract census data for Toronto FSAs.
 
-        Uses the provided row indices to extract only the relevant rows
+        Uses the provided row indices to stream only the relevant rows
         from the main census file, significantly reducing memory usage.
+        Rows whose geographic code doesn't start with the FSA prefix are
+        filtered out as the rows are streamed, and streaming stops at the end
+        of the FSA group.
 
         Args:
             nskiprows: Number of rows to skip from the start of the file
             nrows: Number of rows to read after skipping
 
         Returns:
-            DataFrame with census data for Toronto FSAs
+            Arrow table with census data for Toronto FSAs
 
         Raises:
             FileNotFoundError: If the input file doesn't exist
             IOError: If there's an error reading the file
-            pd.errors.EmptyDataError: If the file is empty
+            pa.ArrowInvalid: If the file is empty or the rows cannot be parsed
         """
-        logger.info(f"Extracting census data from {self.data_input_path}")
-
-        if not os.path.exists(self.data_input_path):
-            logger.error(f"Census data file not found: {self.data_input_path}")
-            raise FileNotFoundError(
-                f"Census data file not found: {self.data_input_path}"
-            )
+        logger.info("Extracting census data from %s", self.data_input_path)
 
         try:
-            # Get original column names to map SYMBOL columns correctly
-            original_columns = pd.read_csv(
-                self.data_input_path, nrows=0, encoding=self.encoding
-            ).columns.tolist()
-
-            new_columns = []
-            column_dtypes = self.config["column_dtypes"].copy()
-
-            # Rename SYMBOL columns to associate them with their data columns
-            for col in original_columns:
-                if col == "SYMBOL":
-                    new_columns.append("C1_SYMBOL")
-                    column_dtypes["C1_SYMBOL"] = "category"
-                elif col.startswith("SYMBOL."):
-                    idx = int(col.split(".")[1])
-                    new_columns.append(f"C{idx + 1}_SYMBOL")
-                    column_dtypes[f"C{idx + 1}_SYMBOL"] = "category"
-                else:
-                    new_columns.append(col)
-
-            # Read the census data with optimized parameters
-            df_census = pd.read_csv(
+            new_columns, _ = self.census_columns
+            include_columns, categories, column_types = self.census_read_columns
+
+            # The renamed columns are given explicitly, so the header row is
+            # skipped along with the rows before the Toronto FSAs
+            with pa_csv.open_csv(
                 self.data_input_path,
-                header=0,
-                encoding=self.encoding,
-                skiprows=range(1, nskiprows),
-                nrows=nrows,
-                names=new_columns,
-                usecols=lambda x: x not in self.config["columns_to_drop"],
-                dtype=column_dtypes,
-            )
+                read_options=pa_csv.ReadOptions(
+                    skip_rows=max(nskiprows, 1),
+                    column_names=new_columns,
+                    block_size=CSV_BLOCK_SIZE,
+                    encoding=self.encoding,
+                ),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types=column_types,
+                    include_columns=include_columns,
+                    strings_can_be_null=True,
+                ),
+            ) as reader:
+                batches, num_rows, toronto_rows = [], 0, 0
+                for batch in reader:
+                    batch = batch.slice(0, nrows - num_rows)
+                    num_rows += batch.num_rows
+
+                    # Strip the geographic code, the key the census data is
+                    # joined on, before it is matched against the FSA prefix
+                    geo_code_index = batch.schema.get_field_index("ALT_GEO_CODE")
+                    batch = batch.set_column(
+                        geo_code_index,
+                        "ALT_GEO_CODE",
+                        pc.utf8_trim_whitespace(batch["ALT_GEO_CODE"]),
+                    )
+
+                    # Filter while streaming, so rows outside the FSA prefix
+                    # are dropped even when the default row indices are used
+                    toronto_batch = batch.filter(
+                        pc.starts_with(batch["ALT_GEO_CODE"], self.fsa_prefix)
+                    )
+                    batches.append(toronto_batch)
+
+                    # The file is ordered by FSA, so once Toronto rows were
+                    # found, a batch with rows outside the prefix ends the group
+                    group_ended = (
+                        toronto_rows > 0 and toronto_batch.num_rows < batch.num_rows
+                    )
+                    toronto_rows += toronto_batch.num_rows
+                    if num_rows >= nrows or group_ended:
+                        break
+
+                table = pa.Table.from_batches(batches, schema=reader.schema)
+
+            for col in categories:
+                table = table.set_column(
+                    table.column_names.index(col), col, encode_categories(table[col])
+                )
 
             logger.info(
-                f"Extracted {len(df_census)} rows and "
-                f"{len(df_census.columns)} columns of census data"
+                "Extracted %d rows and %d columns of census data",
+                table.num_rows,
+                table.num_columns,
             )
-            return df_census
+            return table
 
-        except pd.errors.EmptyDataError:
-            logger.error(f"Empty census data file: {self.data_input_path}")
+        except FileNotFoundError:
+            logger.error("Census data file not found: %s", self.data_input_path)
+            raise
+        except pa.ArrowInvalid as e:
+            logger.error(
+                "Invalid or empty census data file %s: %s", self.data_input_path, e
+            )
             raise
         except OSError as e:
-            logger.error(f"IOError while reading {self.data_input_path}: {e}")
+            logger.error("IOError while reading %s: %s", self.data_input_path, e)
             raise
         except Exception as e:
-            logger.exception(f"Unexpected error while extracting census data: {e}")
+            logger.exception("Unexpected error while extracting census data: %s", e)
             raise
 
-    def extract_data(self) -> pd.DataFrame:
+    def extract_data(self) -> pa.Table:
         """Extract census data in one operation.
 
+        When caching is enabled, a fresh side-car parquet copy of a previous
+        extraction is returned instead of re-reading the CSV files.
+
         Returns:
-            DataFrame with census data for Toronto FSAs
+            Arrow table with census data for Toronto FSAs
         """
+        if self.use_cache:
+            cache_path, stamp_path = cache_paths(self.data_input_path)
+            stamp = source_stamp(
+                self.geo_input_path,
+                self.data_input_path,
+                settings={key: self.config[key] for key in CACHE_SETTINGS},
+            )
+            cached_table = read_cache(cache_path, stamp_path, stamp)
+            if cached_table is not None:
+                return cached_table
+
         # First calculate the row indices
         nskiprows, nrows = self.calculate_row_indices()
 
         # Then extract the census data using those indices
-        df_census = self.extract_census_data(nskiprows, nrows)
+        table = self.extract_census_data(nskiprows, nrows)
+
+        if self.use_cache:
+            write_cache(table, cache_path, stamp_path, stamp)
 
-        return df_census
+        return table
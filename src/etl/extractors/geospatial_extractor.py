@@ -1,5 +1,9 @@
 """Data extraction module for Toronto geospatial data (FSAs and Neighbourhoods)."""
 
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
 import geopandas as gpd
 
 from src.config.etl_config import GEOSPATIAL_CONFIG
@@ -16,7 +20,7 @@ class GeospatialExtractor:
     neighbourhoods and Forward Sortation Areas (FSAs) used in postal codes.
     """
 
-    def __init__(self, config: dict | None = None):
+    def __init__(self, config: Mapping[str, Any] | None = None):
         """Initialize the extractor with configuration.
 
         Args:
@@ -26,11 +30,13 @@ class GeospatialExtractor:
         self.hood_input_path = self.config["hood_input_path"]
         self.fsa_input_path = self.config["fsa_input_path"]
         self.crs = self.config["crs"]
+        self.max_extract_workers = self.config["max_extract_workers"]
 
         logger.info(
-            f"GeospatialExtractor initialized with: "
-            f"neighbourhood path: {self.hood_input_path}, "
-            f"FSA path: {self.fsa_input_path}"
+            "GeospatialExtractor initialized with: "
+            "neighbourhood path: %s, FSA path: %s",
+            self.hood_input_path,
+            self.fsa_input_path,
         )
 
     @retry(IOError, tries=3, delay=2.0)
@@ -43,14 +49,16 @@ class GeospatialExtractor:
         Raises:
             IOError: If there's an error reading the file
         """
-        logger.info(f"Reading neighbourhoods from {self.hood_input_path}")
+        logger.info("Reading neighbourhoods from %s", self.hood_input_path)
 
         try:
-            hoods = gpd.read_file(self.hood_input_path)
-            logger.info(f"Successfully loaded {len(hoods)} neighbourhoods")
+            hoods = gpd.read_file(
+                self.hood_input_path, engine="pyogrio", use_arrow=True
+            )
+            logger.info("Successfully loaded %d neighbourhoods", len(hoods))
             return hoods
         except Exception as e:
-            logger.error(f"Failed to read neighbourhoods file: {e}")
+            logger.error("Failed to read neighbourhoods file: %s", e)
             raise
 
     @retry(IOError, tries=3, delay=2.0)
@@ -63,22 +71,25 @@ class GeospatialExtractor:
         Raises:
             IOError: If there's an error reading the file
         """
-        logger.info(f"Reading FSAs from {self.fsa_input_path}")
+        logger.info("Reading FSAs from %s", self.fsa_input_path)
 
         try:
-            fsas = gpd.read_file(self.fsa_input_path)
-            logger.info(f"Successfully loaded {len(fsas)} FSAs")
+            fsas = gpd.read_file(self.fsa_input_path, engine="pyogrio", use_arrow=True)
+            logger.info("Successfully loaded %d FSAs", len(fsas))
             return fsas
         except Exception as e:
-            logger.error(f"Failed to read FSA file: {e}")
+            logger.error("Failed to read FSA file: %s", e)
             raise
 
     def extract_data(self) -> tuple[gpd.GeoDataFrame, gpd.GeoDataFrame]:
         """Extract both neighbourhoods and FSA data.
 
+        The two files are independent, so they are read concurrently.
+
         Returns:
             Tuple containing (neighbourhoods GeoDataFrame, FSAs GeoDataFrame)
         """
-        hoods = self.extract_hood_data()
-        fsas = self.extract_fsa_data()
-        return hoods, fsas
+        with ThreadPoolExecutor(max_workers=self.max_extract_workers) as executor:
+            hoods = executor.submit(self.extract_hood_data)
+            fsas = executor.submit(self.extract_fsa_data)
+        return hoods.result(), fsas.result()
@@ -7,21 +7,18 @@ This module orchestrates the ETL process for Toronto geospatial data:
 """
 
 import argparse
-import sys
+import logging
+from collections import ChainMap
+from collections.abc import Mapping
 from pathlib import Path
+from typing import Any
 
-# Add the project root to Python path to enable absolute imports
-project_root = Path(__file__).parents[2].absolute()
-sys.path.append(str(project_root))
-
-from src.config.etl_config import GEOSPATIAL_CONFIG  # noqa: E402
-from src.config.logging_config import get_logger  # noqa: E402
-from src.etl.extractors.geospatial_extractor import GeospatialExtractor  # noqa: E402
-from src.etl.loaders.geospatial_loader import GeospatialLoader  # noqa: E402
-from src.etl.transformers.geospatial_transformer import (  # noqa: E402
-    GeospatialTransformer,  # noqa: E402
-)
-from src.utils.etl_metrics import ETLMetrics  # noqa: E402
+from src.config.etl_config import GEOSPATIAL_CONFIG
+from src.config.logging_config import get_logger
+from src.etl.extractors.geospatial_extractor import GeospatialExtractor
+from src.etl.loaders.geospatial_loader import GeospatialLoader
+from src.etl.transformers.geospatial_transformer import GeospatialTransformer
+from src.utils.etl_metrics import ETLMetrics
 
 logger = get_logger("etl.geospatial_pipeline")
 
@@ -33,7 +30,7 @@ class GeospatialPipeline:
     extraction, transformation, and loading steps for geospatial data.
     """
 
-    def __init__(self, config: dict | None = None):
+    def __init__(self, config: Mapping[str, Any] | None = None):
         """Initialize the pipeline with configuration.
 
         Args:
@@ -46,13 +43,17 @@ class GeospatialPipeline:
 
         logger.info("GeospatialPipeline initialized")
 
-    def run(self) -> None:
+    def run(self, metrics: ETLMetrics | None = None) -> None:
         """Run the complete ETL pipeline.
 
         Executes extraction, transformation, and loading steps sequentially,
         with timing and logging for each step.
+
+        Args:
+            metrics: Metrics collector to record into, e.g. to share one across
+                repeated runs (default: a new collector for this run)
         """
-        metrics = ETLMetrics("geospatial_data")
+        metrics = metrics or ETLMetrics("geospatial_data")
         logger.info("Starting geospatial data ETL pipeline")
 
         try:
@@ -65,8 +66,10 @@ class GeospatialPipeline:
             fsa_count = len(raw_data[1])
             total_count = hood_count + fsa_count
             metrics.record_row_count("extract", total_count)
-            logger.info(f"Data extraction completed in {extract_duration:.2f} seconds")
-            logger.info(f"Extracted {hood_count} neighbourhoods and {fsa_count} FSAs")
+            logger.info("Data extraction completed in %.2f seconds", extract_duration)
+            logger.info(
+                "Extracted %d neighbourhoods and %d FSAs", hood_count, fsa_count
+            )
 
             # Transform data
             metrics.start_stage("transform")
@@ -74,10 +77,10 @@ class GeospatialPipeline:
             transform_duration = metrics.end_stage("transform")
             metrics.record_row_count("transform", len(transformed_data))
             logger.info(
-                f"Data transformation completed in {transform_duration:.2f} seconds"
+                "Data transformation completed in %.2f seconds", transform_duration
             )
             logger.info(
-                f"Generated {len(transformed_data)} " f"FSA-neighbourhood intersections"
+                "Generated %d FSA-neighbourhood intersections", len(transformed_data)
             )
 
             # Load data
@@ -85,22 +88,23 @@ class GeospatialPipeline:
             self.loader.load_data(transformed_data)
             load_duration = metrics.end_stage("load")
             metrics.record_row_count("final", len(transformed_data))
-            logger.info(f"Data loading completed in {load_duration:.2f} seconds")
+            logger.info("Data loading completed in %.2f seconds", load_duration)
 
             # Finalize and save metrics
             metrics.finalize()
             metrics_file = metrics.save()
 
             logger.info(
-                f"Pipeline completed successfully in "
-                f"{metrics.metrics['total_duration']:.2f} seconds"
+                "Pipeline completed successfully in %.2f seconds",
+                metrics.metrics["total_duration"],
             )
-            logger.info(f"Metrics saved to {metrics_file}")
-            logger.info("\n" + metrics.summary())
+            logger.info("Metrics saved to %s", metrics_file)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("\n%s", metrics.summary())
 
         except Exception as e:
             metrics.save("failed")
-            logger.exception(f"Pipeline failed: {e}")
+            logger.exception("Pipeline failed: %s", e)
             raise
 
 
@@ -139,26 +143,26 @@ def main():
     """Main entry point for the ETL pipeline."""
     args = parse_args()
 
-    # Create custom config with any overridden paths
-    config = GEOSPATIAL_CONFIG.copy()
+    # Layer the command line overrides over the default config
+    overrides = {}
 
     if args.hood_input:
-        config["hood_input_path"] = Path(args.hood_input)
+        overrides["hood_input_path"] = Path(args.hood_input)
 
     if args.fsa_input:
-        config["fsa_input_path"] = Path(args.fsa_input)
+        overrides["fsa_input_path"] = Path(args.fsa_input)
 
     if args.output:
-        config["output_path"] = Path(args.output)
+        overrides["output_path"] = Path(args.output)
 
     if args.crs:
-        config["crs"] = args.crs
+        overrides["crs"] = args.crs
 
     if args.min_overlap:
-        config["min_overlap_percent"] = args.min_overlap
+        overrides["min_overlap_percent"] = args.min_overlap
 
     # Run the pipeline
-    pipeline = GeospatialPipeline(config)
+    pipeline = GeospatialPipeline(ChainMap(overrides, GEOSPATIAL_CONFIG))
     pipeline.run()
 
 
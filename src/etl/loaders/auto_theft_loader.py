@@ -1,11 +1,15 @@
 """Data loading module for Toronto auto theft data."""
 
 import os
+from collections.abc import Mapping
+from typing import Any
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from src.config.etl_config import AUTO_THEFT_CONFIG
 from src.config.logging_config import get_logger
+from src.utils.arrow_utils import optimize_for_parquet
 from src.utils.error_handling import retry
 
 logger = get_logger(__name__)
@@ -18,7 +22,7 @@ class AutoTheftLoader:
     to parquet format in the processed data directory.
     """
 
-    def __init__(self, config: dict | None = None):
+    def __init__(self, config: Mapping[str, Any] | None = None):
         """Initialize the loader with configuration.
 
         Args:
@@ -26,6 +30,7 @@ class AutoTheftLoader:
         """
         self.config = config or AUTO_THEFT_CONFIG
         self.output_path = self.config["output_path"]
+        self.parquet_options = self.config["parquet_options"]
 
         # Ensure output directory exists
         os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
@@ -33,25 +38,35 @@ class AutoTheftLoader:
         logger.info(f"AutoTheftLoader initialized with output path: {self.output_path}")
 
     @retry(IOError, tries=3, delay=2.0)
-    def load_data(self, df: pd.DataFrame) -> None:
-        """Save the processed DataFrame to parquet format.
+    def load_data(self, table: pa.Table) -> None:
+        """Save the processed table to parquet format.
 
         Args:
-            df: Processed DataFrame to save
+            table: Processed Arrow table to save
 
         Raises:
             IOError: If there's an error writing the file
         """
-        logger.info(f"Saving {len(df)} rows to {self.output_path}")
+        logger.info(f"Saving {table.num_rows} rows to {self.output_path}")
 
         try:
-            # Optimize DataFrame for parquet storage
-            optimized_df = self._optimize_for_parquet(df)
+            # Optimize table for parquet storage
+            optimized_table = optimize_for_parquet(table)
+
+            # Save to parquet format one row group at a time, taking the file
+            # size from the bytes written
+            writer_options = dict(self.parquet_options)
+            row_group_size = writer_options.pop("row_group_size")
+            with pa.OSFile(str(self.output_path), "wb") as sink:
+                with pq.ParquetWriter(
+                    sink, optimized_table.schema, **writer_options
+                ) as writer:
+                    for offset in range(0, optimized_table.num_rows, row_group_size):
+                        writer.write_table(
+                            optimized_table.slice(offset, row_group_size)
+                        )
+                file_size_mb = sink.tell() / (1024 * 1024)
 
-            # Save to parquet format
-            optimized_df.to_parquet(self.output_path, index=False, compression="snappy")
-
-            file_size_mb = os.path.getsize(self.output_path) / (1024 * 1024)
             logger.info(
                 f"Successfully saved data to {self.output_path} ({file_size_mb:.2f} MB)"
             )
@@ -62,31 +77,3 @@ class AutoTheftLoader:
         except Exception as e:
             logger.exception(f"Unexpected error while saving data: {e}")
             raise
-
-    def _optimize_for_parquet(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Optimize DataFrame for parquet storage by adjusting data types.
-
-        Args:
-            df: DataFrame to optimize
-
-        Returns:
-            Optimized DataFrame
-        """
-        optimized_df = df.copy()
-
-        # Ensure category columns are properly stored
-        category_columns = [
-            col
-            for col, dtype in optimized_df.dtypes.items()
-            if dtype.name == "category"
-        ]
-
-        # Convert string columns to categorical if they have low cardinality
-        for col in optimized_df.select_dtypes(include=["object"]).columns:
-            if col not in category_columns:
-                unique_count = optimized_df[col].nunique()
-                if unique_count < 100:  # Threshold for considering categorical
-                    optimized_df[col] = optimized_df[col].astype("category")
-                    logger.debug(f"Converted column '{col}' to category type")
-
-        return optimized_df
@@ -1,9 +1,13 @@
 """Data loading module for Toronto geospatial data (FSAs and Neighbourhoods)."""
 
 import os
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
 
 import geopandas as gpd
-import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from src.config.etl_config import GEOSPATIAL_CONFIG
 from src.config.logging_config import get_logger
@@ -19,7 +23,7 @@ class GeospatialLoader:
     to parquet format in the processed data directory.
     """
 
-    def __init__(self, config: dict | None = None):
+    def __init__(self, config: Mapping[str, Any] | None = None):
         """Initialize the loader with configuration.
 
         Args:
@@ -27,6 +31,7 @@ class GeospatialLoader:
         """
         self.config = config or GEOSPATIAL_CONFIG
         self.output_path = self.config["output_path"]
+        self.parquet_options = self.config["parquet_options"]
 
         # Ensure output directory exists
         os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
@@ -34,7 +39,6 @@ class GeospatialLoader:
         logger.info("GeospatialLoader initialized.")
         logger.info(f"Output path: {self.output_path}")
 
-    @retry(IOError, tries=3, delay=2.0)
     def load_data(self, df: gpd.GeoDataFrame) -> None:
         """Save the processed GeoDataFrame to parquet format.
 
@@ -47,19 +51,34 @@ class GeospatialLoader:
         logger.info(f"Saving {len(df)} rows to {self.output_path}")
 
         try:
-            # Convert to pandas DataFrame (dropping geometry)
-            # if it's a GeoDataFrame and has a geometry column
-            if isinstance(df, gpd.GeoDataFrame) and "geometry" in df.columns:
-                # ["AREA_LONG_CODE", ...]' was always true and thus redundant.
-                df = pd.DataFrame(df[["AREA_LONG_CODE", "CFSAUID", "overlap_percent"]])
-                logger.info("Converted GeoDataFrame to DataFrame, dropping geometry")
-            elif isinstance(df, gpd.GeoDataFrame):
-                df = pd.DataFrame(df[["AREA_LONG_CODE", "CFSAUID", "overlap_percent"]])
-                logger.info("Converted GeoDataFrame to DataFrame (standard columns).")
-
-            # Save to parquet format
-            df.to_parquet(self.output_path, index=False, compression="snappy")
-            logger.info(f"Successfully saved data to {self.output_path}")
+            # Keep only the overlap columns, which drops any geometry column;
+            # categorical codes are written as dictionary-encoded columns
+            table = pa.Table.from_pandas(
+                df[["AREA_LONG_CODE", "CFSAUID", "overlap_percent"]],
+                preserve_index=False,
+            )
+
+            file_size_mb = self._write_parquet(table, self.output_path)
+
+            logger.info(
+                f"Successfully saved data to {self.output_path} ({file_size_mb:.2f} MB)"
+            )
         except Exception as e:
             logger.error(f"Failed to save data to {self.output_path}: {e}")
             raise
+
+    @retry(IOError, tries=3, delay=2.0)
+    def _write_parquet(self, table: pa.Table, path: Path) -> float:
+        """Write a table to parquet, retrying only the write itself.
+
+        Args:
+            table: Arrow table to write
+            path: Path of the parquet file
+
+        Returns:
+            Size of the written file in MB
+        """
+        # Take the file size from the bytes written
+        with pa.OSFile(str(path), "wb") as sink:
+            pq.write_table(table, sink, **self.parquet_options)
+            return sink.tell() / (1024 * 1024)
@@ -1,9 +1,15 @@
 """Data transformation module for Toronto auto theft data."""
 
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from src.config.etl_config import AUTO_THEFT_CONFIG
 from src.config.logging_config import get_logger
+from src.utils.arrow_utils import table_to_pandas
 from src.utils.validation import (
     validate_coordinates,
     validate_date_logic,
@@ -21,39 +27,52 @@ class AutoTheftTransformer:
     and feature engineering.
     """
 
-    def __init__(self, config: dict | None = None):
+    def __init__(self, config: Mapping[str, Any] | None = None):
         """Initialize the transformer with configuration.
 
         Args:
             config: Configuration dictionary overriding default settings
         """
         self.config = config or AUTO_THEFT_CONFIG
+        self.column_dtypes = self.config["column_dtypes"]
         self.coord_validation = self.config["coord_validation"]
         self.valid_years = self.config["valid_years"]
         self.hour_bins = self.config["hour_bins"]
         self.hour_labels = self.config["hour_labels"]
         self.season_map = self.config["season_map"]
-        self.season_order = self.config["season_order"]
+        self.season_dtype = self.config["season_dtype"]
         self.weekend_days = self.config["weekend_days"]
 
+        # Time bin code of each hour of the day, followed by -1 for missing or
+        # out-of-range hours, so bins are looked up instead of cut per row
+        hour_bins = pd.cut(
+            np.arange(24), bins=self.hour_bins, labels=self.hour_labels, ordered=False
+        )
+        self.hour_bin_dtype = hour_bins.dtype
+        self.hour_bin_codes = np.append(hour_bins.codes, -1).astype(np.int8)
+
         logger.info("AutoTheftTransformer initialized")
 
-    def transform_data(self, df: pd.DataFrame) -> pd.DataFrame:
+    def transform_data(self, table: pa.Table) -> pa.Table:
         """Transform auto theft data through a series of cleaning and enrichment steps.
 
+        The data is converted to pandas for the transformation steps only. The
+        steps own the converted DataFrame, so they modify it in place rather
+        than copying it.
+
         Args:
-            df: DataFrame with raw auto theft data
+            table: Arrow table with raw auto theft data, consumed by this call
 
         Returns:
-            Cleaned and transformed DataFrame
+            Cleaned and transformed Arrow table
         """
-        logger.info(f"Starting data transformation on {len(df)} rows")
+        logger.info(f"Starting data transformation on {table.num_rows} rows")
+        df = table_to_pandas(table, self.column_dtypes)
 
         # Apply transformation steps sequentially
         df = self._fix_timestamps(df)
         df = self._remove_duplicates(df)
-        df = self._drop_null_occurrence_dates(df)
-        df = self._drop_rows_without_geospatial_info(df)
+        df = self._drop_incomplete_rows(df)
         df = self._impute_missing_hood_with_division(df)
         df = self._impute_missing_coordinates(df)
 
@@ -66,7 +85,7 @@ class AutoTheftTransformer:
         df = self._add_weekend_feature(df)
 
         logger.info(f"Completed transformation, resulting in {len(df)} rows")
-        return df
+        return pa.Table.from_pandas(df, preserve_index=False)
 
     def _fix_timestamps(self, df: pd.DataFrame) -> pd.DataFrame:
         """Fix the timestamps in date columns using hour columns.
@@ -79,27 +98,18 @@ class AutoTheftTransformer:
         """
         logger.info("Fixing timestamps in date columns")
 
-        df_copy = df.copy()
-
-        # Fix REPORT_DATE timestamp using REPORT_HOUR
-        df_copy["REPORT_DATE"] = df_copy.apply(
-            lambda x: x["REPORT_DATE"].replace(
-                hour=int(x["REPORT_HOUR"]), minute=0, second=0
-            )
-            if pd.notnull(x["REPORT_HOUR"])
-            else x["REPORT_DATE"],
-            axis=1,
-        )
-
-        # Fix OCC_DATE timestamp using OCC_HOUR
-        df_copy["OCC_DATE"] = df_copy.apply(
-            lambda x: x["OCC_DATE"].replace(hour=int(x["OCC_HOUR"]), minute=0, second=0)
-            if pd.notnull(x["OCC_HOUR"])
-            else x["OCC_DATE"],
-            axis=1,
-        )
+        # Set the hour of each timestamp from its hour column, keeping the
+        # original timestamp where the hour is missing
+        for date_col, hour_col in (
+            ("REPORT_DATE", "REPORT_HOUR"),
+            ("OCC_DATE", "OCC_HOUR"),
+        ):
+            hours = df[hour_col]
+            df[date_col] = (
+                df[date_col].dt.normalize() + pd.to_timedelta(hours, unit="h")
+            ).where(hours.notna(), df[date_col])
 
-        return df_copy
+        return df
 
     def _remove_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
         """Remove duplicate rows from the DataFrame.
@@ -110,65 +120,48 @@ class AutoTheftTransformer:
         Returns:
             DataFrame with duplicates removed
         """
-        initial_count = len(df)
-        df_dedup = df.drop_duplicates(keep="first").reset_index(drop=True)
+        # A duplicate row repeats its EVENT_UNIQUE_ID, so only the rows with a
+        # repeated ID are compared across all columns
+        candidates = df[df["EVENT_UNIQUE_ID"].duplicated(keep=False)]
+        duplicate_rows = candidates.duplicated(keep="first")
+        df_dedup = df.drop(index=candidates.index[duplicate_rows])
 
         # Check for duplicate EVENT_UNIQUE_IDs with different data
-        unique_id_count = df_dedup["EVENT_UNIQUE_ID"].nunique()
-        if len(df_dedup) != unique_id_count:
+        id_collisions = candidates.loc[~duplicate_rows, "EVENT_UNIQUE_ID"].duplicated()
+        if id_collisions.any():
             logger.warning(
-                f"Found {len(df_dedup) - unique_id_count} rows with duplicate "
+                f"Found {id_collisions.sum()} rows with duplicate "
                 "EVENT_UNIQUE_ID but different data"
             )
 
-        logger.info(f"Removed {initial_count - len(df_dedup)} duplicate rows")
+        logger.info(f"Removed {duplicate_rows.sum()} duplicate rows")
         return df_dedup
 
-    def _drop_null_occurrence_dates(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Drop rows with null occurrence date components.
-
-        Args:
-            df: DataFrame with possibly null occurrence dates
-
-        Returns:
-            DataFrame with rows having null occurrence dates removed
-        """
-        initial_count = len(df)
-        df_clean = df.dropna(
-            subset=["OCC_YEAR", "OCC_DAY", "OCC_DOY"],
-            how="all",
-        ).reset_index(drop=True)
-
-        logger.info(
-            f"Removed {initial_count - len(df_clean)} rows with null occurrence dates"
-        )
-        return df_clean
-
-    def _drop_rows_without_geospatial_info(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Drop rows that lack all geospatial information.
+    def _drop_incomplete_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Drop rows with null occurrence dates or lacking all geospatial info.
 
         Args:
-            df: DataFrame with possibly missing geospatial info
+            df: DataFrame with possibly incomplete rows
 
         Returns:
-            DataFrame with rows lacking all geospatial info removed
+            DataFrame with incomplete rows removed
         """
-        initial_count = len(df)
+        # Identify rows with all occurrence date components missing
+        occ_null = df[["OCC_YEAR", "OCC_DAY", "OCC_DOY"]].isna().all(axis=1)
 
         # Identify rows with no geospatial information
-        mask = (
+        geo_null = (
             df["LAT_WGS84"].isna()
             & df["LONG_WGS84"].isna()
             & df["HOOD_158"].isna()
             & df["DIVISION"].isna()
         )
 
-        df_clean = df[~mask].reset_index(drop=True)
-
+        logger.info(f"Removed {occ_null.sum()} rows with null occurrence dates")
         logger.info(
-            f"Removed {initial_count - len(df_clean)} rows lacking all geospatial info"
+            f"Removed {(geo_null & ~occ_null).sum()} rows lacking all geospatial info"
         )
-        return df_clean
+        return df[~(occ_null | geo_null)]
 
     def _impute_missing_hood_with_division(self, df: pd.DataFrame) -> pd.DataFrame:
         """Impute missing HOOD_158 and NEIGHBOURHOOD_158 using DIVISION.
@@ -179,54 +172,57 @@ class AutoTheftTransformer:
         Returns:
             DataFrame with imputed neighborhood information
         """
-        df_imputed = df.copy()
-
         # Identify rows with missing hood but valid division
-        mask = df_imputed["HOOD_158"].isna() & df_imputed["DIVISION"].notna()
+        mask = df["HOOD_158"].isna() & df["DIVISION"].notna()
         missing_hood_count = mask.sum()
 
         if missing_hood_count == 0:
             logger.info("No missing neighborhoods to impute")
-            return df_imputed
+            return df
 
         logger.info(
             f"Imputing {missing_hood_count} missing neighborhoods using division"
         )
 
-        # Build a lookup: DIVISION -> modal HOOD_158
-        hood_mode_by_div = (
-            df_imputed[df_imputed["HOOD_158"].notna()]  # only rows with a known hood
-            .groupby("DIVISION")["HOOD_158"]
-            .agg(
-                lambda s: s.mode().iat[0] if not s.empty and len(s.mode()) > 0 else None
-            )
+        # Build a lookup: DIVISION -> modal HOOD_158, breaking ties towards the
+        # first hood in sort order like Series.mode does
+        hood_counts = (
+            df[df["HOOD_158"].notna()]  # only rows with a known hood
+            .groupby(["DIVISION", "HOOD_158"], observed=True)
+            .size()
+            .reset_index(name="count")
+        )
+        modal_hoods = hood_counts.sort_values(
+            "count", ascending=False, kind="stable"
+        ).drop_duplicates("DIVISION")
+        hood_mode_by_div = dict(
+            zip(modal_hoods["DIVISION"], modal_hoods["HOOD_158"], strict=True)
         )
 
         # Build a lookup to get the neighbourhood name as well
-        name_lookup = (
-            df_imputed[["HOOD_158", "NEIGHBOURHOOD_158"]]
-            .dropna()
-            .drop_duplicates()
-            .set_index("HOOD_158")["NEIGHBOURHOOD_158"]
+        hood_names = df[["HOOD_158", "NEIGHBOURHOOD_158"]].dropna().drop_duplicates()
+        name_lookup = dict(
+            zip(hood_names["HOOD_158"], hood_names["NEIGHBOURHOOD_158"], strict=True)
         )
 
-        # Apply to rows whose hood is missing but division known
-        df_imputed.loc[mask, "HOOD_158"] = df_imputed.loc[mask, "DIVISION"].map(
-            hood_mode_by_div
+        # Apply to rows whose hood is missing but division known, mapping plain
+        # values since a mapped categorical only keeps the mapped categories
+        df.loc[mask, "HOOD_158"] = (
+            df.loc[mask, "DIVISION"].astype(object).map(hood_mode_by_div)
+        )
+        df.loc[mask, "NEIGHBOURHOOD_158"] = (
+            df.loc[mask, "HOOD_158"].astype(object).map(name_lookup)
         )
-        df_imputed.loc[mask, "NEIGHBOURHOOD_158"] = df_imputed.loc[
-            mask, "HOOD_158"
-        ].map(name_lookup)
 
         # Check if imputation was successful
-        still_missing = df_imputed.loc[mask, "HOOD_158"].isna().sum()
+        still_missing = df.loc[mask, "HOOD_158"].isna().sum()
         if still_missing > 0:
             logger.warning(
                 f"Could not impute {still_missing} neighborhoods due to "
                 "missing lookup data"
             )
 
-        return df_imputed
+        return df
 
     def _impute_missing_coordinates(self, df: pd.DataFrame) -> pd.DataFrame:
         """Impute missing LAT_WGS84 and LONG_WGS84 using HOOD_158 centroids.
@@ -237,59 +233,30 @@ class AutoTheftTransformer:
         Returns:
             DataFrame with imputed coordinates
         """
-        df_imputed = df.copy()
-
         # Check for missing coordinates
-        missing_coord_mask = (
-            df_imputed["LAT_WGS84"].isna() | df_imputed["LONG_WGS84"].isna()
-        )
+        missing_coord_mask = df["LAT_WGS84"].isna() | df["LONG_WGS84"].isna()
         missing_coord_count = missing_coord_mask.sum()
 
         if missing_coord_count == 0:
             logger.info("No missing coordinates to impute")
-            return df_imputed
+            return df
 
         logger.info(
             f"Imputing {missing_coord_count} missing coordinates "
             "using neighborhood centroids"
         )
 
-        # Calculate centroids for each neighbourhood
-        centroids = df_imputed.groupby("HOOD_158", observed=False)[
-            ["LAT_WGS84", "LONG_WGS84"]
-        ].median()
-
         # Fill missing coordinates with the centroid of the same neighbourhood
-        df_with_centroids = (
-            df_imputed.set_index("HOOD_158")
-            .join(centroids, rsuffix="_cent")
-            .reset_index()
-        )
-
-        # Apply imputation where needed
-        mask_lat = df_with_centroids["LAT_WGS84"].isna()
-        mask_long = df_with_centroids["LONG_WGS84"].isna()
-
-        df_with_centroids.loc[mask_lat, "LAT_WGS84"] = df_with_centroids.loc[
-            mask_lat, "LAT_WGS84_cent"
-        ]
-        df_with_centroids.loc[mask_long, "LONG_WGS84"] = df_with_centroids.loc[
-            mask_long, "LONG_WGS84_cent"
-        ]
-
-        # Remove the temporary centroid columns
-        df_imputed = df_with_centroids.drop(
-            columns=["LAT_WGS84_cent", "LONG_WGS84_cent"]
-        )
+        hood_coords = df.groupby("HOOD_158", observed=False)
+        for col in ("LAT_WGS84", "LONG_WGS84"):
+            df[col] = df[col].fillna(hood_coords[col].transform("median"))
 
         # Check if there are still missing coordinates
-        still_missing = (
-            df_imputed["LAT_WGS84"].isna().sum() + df_imputed["LONG_WGS84"].isna().sum()
-        )
+        still_missing = df["LAT_WGS84"].isna().sum() + df["LONG_WGS84"].isna().sum()
         if still_missing > 0:
             logger.warning(f"Could not impute {still_missing} coordinate values")
 
-        return df_imputed
+        return df
 
     def _validate_and_filter_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Validate and filter data based on various criteria.
@@ -302,12 +269,9 @@ class AutoTheftTransformer:
         """
         logger.info("Validating and filtering data")
 
-        df_valid = df.copy()
-        initial_count = len(df_valid)
-
         # Validate coordinates are within Toronto boundaries
-        valid_df, invalid_coords = validate_coordinates(
-            df_valid,
+        keep = validate_coordinates(
+            df,
             "LAT_WGS84",
             "LONG_WGS84",
             self.coord_validation["lat_min"],
@@ -316,41 +280,41 @@ class AutoTheftTransformer:
             self.coord_validation["long_max"],
         )
 
-        if len(invalid_coords) > 0:
+        invalid_coords = (~keep).sum()
+        if invalid_coords > 0:
             logger.warning(
-                f"Found {len(invalid_coords)} rows with coordinates "
+                f"Found {invalid_coords} rows with coordinates "
                 "outside Toronto boundaries"
             )
-            df_valid = valid_df
 
-        # Validate occurrence date is not later than report date
-        valid_df, invalid_dates = validate_date_logic(
-            df_valid, "OCC_DATE", "REPORT_DATE"
-        )
+        # Validate occurrence date is not later than report date, counting
+        # only rows that passed the previous checks
+        valid_dates = validate_date_logic(df, "OCC_DATE", "REPORT_DATE")
 
-        if len(invalid_dates) > 0:
+        invalid_dates = (keep & ~valid_dates).sum()
+        if invalid_dates > 0:
             logger.warning(
-                f"Found {len(invalid_dates)} rows with occurrence date "
+                f"Found {invalid_dates} rows with occurrence date "
                 "later than report date"
             )
-            df_valid = valid_df
+        keep &= valid_dates
 
-        # Validate occurrence date is within expected range (2013-2024)
-        valid_df, invalid_years = validate_date_range(
-            df_valid, "OCC_DATE", "2013-01-01", "2024-12-31"
+        # Validate occurrence date is within the configured valid years
+        first_year, last_year = self.valid_years.min(), self.valid_years.max()
+        valid_years = validate_date_range(
+            df, "OCC_DATE", f"{first_year}-01-01", f"{last_year}-12-31"
         )
 
-        if len(invalid_years) > 0:
+        invalid_years = (keep & ~valid_years).sum()
+        if invalid_years > 0:
             logger.warning(
-                f"Found {len(invalid_years)} rows with occurrence date "
-                "outside valid range (2013-2024)"
+                f"Found {invalid_years} rows with occurrence date "
+                f"outside valid range ({first_year}-{last_year})"
             )
-            df_valid = valid_df
+        keep &= valid_years
 
-        logger.info(
-            f"Removed {initial_count - len(df_valid)} rows that failed validation"
-        )
-        return df_valid.reset_index(drop=True)
+        logger.info(f"Removed {(~keep).sum()} rows that failed validation")
+        return df[keep].reset_index(drop=True)
 
     def _add_time_bin_feature(self, df: pd.DataFrame) -> pd.DataFrame:
         """Add time bin feature based on occurrence hour.
@@ -363,16 +327,13 @@ class AutoTheftTransformer:
         """
         logger.info("Adding OCC_TIME_BIN feature")
 
-        df_with_feature = df.copy()
-
-        df_with_feature["OCC_TIME_BIN"] = pd.cut(
-            df_with_feature["OCC_HOUR"],
-            bins=self.hour_bins,
-            labels=self.hour_labels,
-            ordered=False,
+        hours = df["OCC_HOUR"].to_numpy(dtype=np.int16, na_value=-1)
+        hours = np.where((hours >= 0) & (hours < 24), hours, 24)
+        df["OCC_TIME_BIN"] = pd.Categorical.from_codes(
+            self.hour_bin_codes[hours], dtype=self.hour_bin_dtype
         )
 
-        return df_with_feature
+        return df
 
     def _add_season_feature(self, df: pd.DataFrame) -> pd.DataFrame:
         """Add season feature based on occurrence month.
@@ -385,14 +346,17 @@ class AutoTheftTransformer:
         """
         logger.info("Adding SEASON feature")
 
-        df_with_feature = df.copy()
-
-        df_with_feature["SEASON"] = df_with_feature["OCC_MONTH"].map(self.season_map)
-        df_with_feature["SEASON"] = pd.Categorical(
-            df_with_feature["SEASON"], categories=self.season_order, ordered=False
+        # Season code of each month category, followed by -1 for missing months
+        months = df["OCC_MONTH"].cat
+        season_codes = self.season_dtype.categories.get_indexer(
+            self.season_map.reindex(months.categories)
+        )
+        season_codes = np.append(season_codes, -1).astype(np.int8)
+        df["SEASON"] = pd.Categorical.from_codes(
+            season_codes[months.codes], dtype=self.season_dtype
         )
 
-        return df_with_feature
+        return df
 
     def _add_weekend_feature(self, df: pd.DataFrame) -> pd.DataFrame:
         """Add weekend indicator feature based on occurrence day of week.
@@ -405,10 +369,9 @@ class AutoTheftTransformer:
         """
         logger.info("Adding IS_WEEKEND feature")
 
-        df_with_feature = df.copy()
+        # Weekend flag of each day category, followed by False for missing days
+        days = df["OCC_DOW"].cat
+        is_weekend = np.append(days.categories.isin(self.weekend_days), False)
+        df["IS_WEEKEND"] = is_weekend[days.codes]
 
-        df_with_feature["IS_WEEKEND"] = df_with_feature["OCC_DOW"].isin(
-            self.weekend_days
-        )
-
-        return df_with_feature
+        return df
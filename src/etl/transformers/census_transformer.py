@@ -1,9 +1,14 @@
 """Data transformation module for Canada Census 2021 data."""
 
+from collections.abc import Mapping
+from typing import Any
+
 import pandas as pd
+import pyarrow as pa
 
 from src.config.etl_config import CENSUS_CONFIG
 from src.config.logging_config import get_logger
+from src.utils.arrow_utils import table_to_pandas
 
 logger = get_logger(__name__)
 
@@ -16,7 +21,7 @@ class CensusTransformer:
     features, and filtering data based on specified criteria.
     """
 
-    def __init__(self, config: dict | None = None):
+    def __init__(self, config: Mapping[str, Any] | None = None):
         """Initialize the transformer with configuration.
 
         Args:
@@ -24,19 +29,23 @@ class CensusTransformer:
         """
         self.config = config or CENSUS_CONFIG
         self.max_characteristic_level = self.config["max_characteristic_level"]
+        self.column_dtypes = self.config["column_dtypes"]
 
         logger.info("CensusTransformer initialized")
 
-    def transform_data(self, df: pd.DataFrame) -> pd.DataFrame:
+    def transform_data(self, table: pa.Table) -> pa.Table:
         """Transform census data through a series of cleaning and enrichment steps.
 
+        The data is converted to pandas for the transformation steps only.
+
         Args:
-            df: DataFrame with raw census data
+            table: Arrow table with raw census data, consumed by this call
 
         Returns:
-            Cleaned and transformed DataFrame
+            Cleaned and transformed Arrow table
         """
-        logger.info(f"Starting census data transformation on {len(df)} rows")
+        logger.info(f"Starting census data transformation on {table.num_rows} rows")
+        df = table_to_pandas(table, self.column_dtypes)
 
         # Apply transformation steps sequentially
         df = self._check_identify_values(df)
@@ -45,7 +54,7 @@ class CensusTransformer:
         df = self._optimize_data_types(df)
 
         logger.info(f"Completed transformation, resulting in {len(df)} rows")
-        return df
+        return pa.Table.from_pandas(df, preserve_index=False)
 
     def _check_identify_values(self, df: pd.DataFrame) -> pd.DataFrame:
         """Check if ALT_GEO_CODE and GEO_NAME are the same.
@@ -93,10 +102,10 @@ class CensusTransformer:
 
         df_copy = df.copy()
 
-        # Extract hierarchy level from leading spaces
-        df_copy["CHARACTERISTIC_LEVEL"] = df_copy["CHARACTERISTIC_NAME"].apply(
-            lambda x: int((len(x) - len(x.lstrip(" "))) / 2)
-        )
+        # Extract hierarchy level from leading spaces, two per level
+        names = df_copy["CHARACTERISTIC_NAME"].astype("string[pyarrow]")
+        leading_spaces = names.str.len() - names.str.lstrip(" ").str.len()
+        df_copy["CHARACTERISTIC_LEVEL"] = (leading_spaces // 2).astype("int8")
 
         # Clean up the CHARACTERISTIC_NAME by removing leading/trailing spaces
         df_copy["CHARACTERISTIC_NAME"] = df_copy["CHARACTERISTIC_NAME"].str.strip()
@@ -140,35 +149,13 @@ class CensusTransformer:
         """
         logger.info("Optimizing data types")
 
-        df_optimized = df.copy()
-
-        # Convert CHARACTERISTIC_NAME to category
-        if "CHARACTERISTIC_NAME" in df_optimized.columns:
-            df_optimized["CHARACTERISTIC_NAME"] = df_optimized[
-                "CHARACTERISTIC_NAME"
-            ].astype("category")
-
-        # Ensure ALT_GEO_CODE is the right type for joining with other datasets
-        if "ALT_GEO_CODE" in df_optimized.columns:
-            df_optimized["ALT_GEO_CODE"] = (
-                df_optimized["ALT_GEO_CODE"].astype(str).str.strip()
-            )
-
-        # Find numeric data columns (those starting with C and not ending with SYMBOL)
-        # data_columns = [
-        #     col
-        #     for col in df_optimized.columns
-        #     if col.startswith("C") and not col.endswith("SYMBOL")
-        # ]
-
-        # For columns with low cardinality, convert to category
-        for col in df_optimized.select_dtypes(include=["object"]).columns:
-            unique_count = df_optimized[col].nunique()
-            if unique_count < 100:  # Threshold for considering categorical
-                df_optimized[col] = df_optimized[col].astype("category")
+        # Convert CHARACTERISTIC_NAME to category; the remaining low-cardinality
+        # string columns are dictionary-encoded by the loader on the Arrow table
+        if "CHARACTERISTIC_NAME" in df.columns:
+            df["CHARACTERISTIC_NAME"] = df["CHARACTERISTIC_NAME"].astype("category")
 
         # Log memory usage
-        memory_usage_mb = df_optimized.memory_usage(deep=True).sum() / 1e6
+        memory_usage_mb = df.memory_usage(deep=False).sum() / 1e6
         logger.info(f"Optimized DataFrame size: {memory_usage_mb:.2f} MB")
 
-        return df_optimized
+        return df
@@ -1,5 +1,8 @@
 """Data transformation module for Toronto geospatial data (FSAs and Neighbourhoods)."""
 
+from collections.abc import Mapping
+from typing import Any
+
 import geopandas as gpd
 
 from src.config.etl_config import GEOSPATIAL_CONFIG
@@ -16,7 +19,7 @@ class GeospatialTransformer:
     areal-weighted interpolation.
     """
 
-    def __init__(self, config: dict | None = None):
+    def __init__(self, config: Mapping[str, Any] | None = None):
         """Initialize the transformer with configuration.
 
         Args:
@@ -58,23 +61,28 @@ class GeospatialTransformer:
         # Calculate FSA areas
         fsas["fsa_area"] = fsas.geometry.area
 
-        # Perform spatial intersection
+        # Perform spatial intersection; overlay already pairs the geometries
+        # through a spatial index, so only the needed columns are passed along
         logger.info("Calculating spatial intersection between FSAs and neighbourhoods")
-        intersect = gpd.overlay(fsas, hoods, how="intersection")
-
-        # Calculate intersection areas and overlap percentages
-        intersect["intersect_area"] = intersect.geometry.area
-        intersect = intersect.merge(fsas[["CFSAUID"]], on="CFSAUID")
-        intersect["overlap_percent"] = (
-            intersect["intersect_area"] / intersect["fsa_area"]
+        intersect = gpd.overlay(
+            fsas[["CFSAUID", "fsa_area", fsas.geometry.name]],
+            hoods[["AREA_LONG_CODE", hoods.geometry.name]],
+            how="intersection",
         )
 
+        # Calculate overlap percentages on the plain area arrays
+        overlap = intersect.geometry.area.to_numpy() / intersect["fsa_area"].to_numpy()
+
         # Filter out negligible overlaps
-        intersect = intersect[intersect["overlap_percent"] >= self.min_overlap_percent]
-        logger.info(f"Found {len(intersect)} significant spatial intersections")
+        significant = overlap >= self.min_overlap_percent
+        logger.info(f"Found {significant.sum()} significant spatial intersections")
 
-        # Select only the needed columns
-        result = intersect[["AREA_LONG_CODE", "CFSAUID", "overlap_percent"]]
+        # Select only the needed columns; the codes repeat across overlaps and
+        # the overlap ratios do not need double precision
+        result = intersect.loc[significant, ["AREA_LONG_CODE", "CFSAUID"]].astype(
+            "category"
+        )
+        result["overlap_percent"] = overlap[significant].astype("float32")
 
         logger.info("Spatial transformation completed successfully")
         return result
@@ -2,26 +2,56 @@
 """CLI script for running all Toronto Auto Theft ETL pipelines."""
 
 import argparse
+import importlib
 import logging
+import multiprocessing
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 # Add the project root to Python path to enable absolute imports
 project_root = Path(__file__).parents[1].absolute()
 sys.path.append(str(project_root))
 
-from src.config.etl_config import (  # noqa: E402
-    AUTO_THEFT_CONFIG,
-    CENSUS_CONFIG,
-    GEOSPATIAL_CONFIG,
+from src.config.logging_config import (  # noqa: E402
+    get_logger,
+    log_listener,
+    log_to_queue,
 )
-from src.config.logging_config import get_logger  # noqa: E402
-from src.etl.auto_theft_pipeline import AutoTheftPipeline  # noqa: E402
-from src.etl.census_pipeline import CensusPipeline  # noqa: E402
-from src.etl.geospatial_pipeline import GeospatialPipeline  # noqa: E402
 
 logger = get_logger("etl.run_all_pipelines")
 
+# Pipeline module, class and config names by pipeline name; worker processes
+# import only the pipeline they run, which also avoids pickling the configs
+PIPELINES = {
+    "Auto Theft": (
+        "src.etl.auto_theft_pipeline",
+        "AutoTheftPipeline",
+        "AUTO_THEFT_CONFIG",
+    ),
+    "Census": ("src.etl.census_pipeline", "CensusPipeline", "CENSUS_CONFIG"),
+    "Geospatial": (
+        "src.etl.geospatial_pipeline",
+        "GeospatialPipeline",
+        "GEOSPATIAL_CONFIG",
+    ),
+}
+
+
+def _run_pipeline(name: str, log_level: str) -> None:
+    """Run a single ETL pipeline in a worker process.
+
+    Args:
+        name: Name of the pipeline in PIPELINES
+        log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+    """
+    logging.getLogger().setLevel(log_level)
+
+    module_name, class_name, config_name = PIPELINES[name]
+    pipeline_class = getattr(importlib.import_module(module_name), class_name)
+    config = getattr(importlib.import_module("src.config.etl_config"), config_name)
+    pipeline_class(config).run()
+
 
 def run_all_pipelines(
     run_auto_theft=True, run_census=True, run_geospatial=True, log_level="INFO"
@@ -40,48 +70,52 @@ def run_all_pipelines(
     success_count = 0
     failure_count = 0
 
+    selected = [
+        name
+        for name, run in (
+            ("Auto Theft", run_auto_theft),
+            ("Census", run_census),
+            ("Geospatial", run_geospatial),
+        )
+        if run
+    ]
+
     logger.info("Starting ETL pipeline execution")
 
-    # Run auto theft pipeline
-    if run_auto_theft:
-        try:
-            logger.info("Running Auto Theft pipeline...")
-            auto_theft_pipeline = AutoTheftPipeline(AUTO_THEFT_CONFIG)
-            auto_theft_pipeline.run()
-            success_count += 1
-            logger.info("Auto Theft pipeline completed successfully")
-        except Exception as e:
-            failure_count += 1
-            logger.error(f"Auto Theft pipeline failed: {e}")
-
-    # Run census pipeline
-    if run_census:
-        try:
-            logger.info("Running Census pipeline...")
-            census_pipeline = CensusPipeline(CENSUS_CONFIG)
-            census_pipeline.run()
-            success_count += 1
-            logger.info("Census pipeline completed successfully")
-        except Exception as e:
-            failure_count += 1
-            logger.error(f"Census pipeline failed: {e}")
-
-    # Run geospatial pipeline
-    if run_geospatial:
-        try:
-            logger.info("Running Geospatial pipeline...")
-            geospatial_pipeline = GeospatialPipeline(GEOSPATIAL_CONFIG)
-            geospatial_pipeline.run()
-            success_count += 1
-            logger.info("Geospatial pipeline completed successfully")
-        except Exception as e:
-            failure_count += 1
-            logger.error(f"Geospatial pipeline failed: {e}")
+    # The pipelines share no data, so each runs in its own process; their
+    # records are logged through a queue, so only this process writes the
+    # log file
+    log_queue = multiprocessing.Queue()
+    listener = log_listener(log_queue)
+    listener.start()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=len(selected) or 1,
+            initializer=log_to_queue,
+            initargs=(log_queue,),
+        ) as executor:
+            futures = {}
+            for name in selected:
+                logger.info("Running %s pipeline...", name)
+                futures[executor.submit(_run_pipeline, name, log_level)] = name
+
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    future.result()
+                    success_count += 1
+                    logger.info("%s pipeline completed successfully", name)
+                except Exception as e:
+                    failure_count += 1
+                    logger.error("%s pipeline failed: %s", name, e)
+    finally:
+        listener.stop()
 
     # Summary
     logger.info(
-        f"ETL pipeline execution completed: {success_count} succeeded, "
-        f"{failure_count} failed"
+        "ETL pipeline execution completed: %d succeeded, %d failed",
+        success_count,
+        failure_count,
     )
     return success_count, failure_count
 
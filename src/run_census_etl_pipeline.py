@@ -3,15 +3,13 @@
 
 import argparse
 import sys
+from collections import ChainMap
 from pathlib import Path
 
 # Add the project root to Python path to enable absolute imports
 project_root = Path(__file__).parents[1].absolute()
 sys.path.append(str(project_root))
 
-from src.config.etl_config import CENSUS_CONFIG  # noqa: E402
-from src.etl.census_pipeline import CensusPipeline  # noqa: E402
-
 
 def main():
     """Main entry point for the CLI interface."""
@@ -40,6 +38,11 @@ def main():
         help="Maximum characteristic hierarchy level to include (overrides default)",
         default=None,
     )
+    parser.add_argument(
+        "--use-cache",
+        action="store_true",
+        help="Reuse a cached parquet copy of the raw data if it is up to date",
+    )
     parser.add_argument(
         "--log-level",
         choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
@@ -49,23 +52,31 @@ def main():
 
     args = parser.parse_args()
 
-    # Create custom config with any overridden paths
-    config = CENSUS_CONFIG.copy()
+    # Import the pipeline only after parsing, so --help skips loading its
+    # data libraries
+    from src.config.etl_config import CENSUS_CONFIG
+    from src.etl.census_pipeline import CensusPipeline
+
+    # Layer the command line overrides over the default config
+    overrides = {}
 
     if args.geo_input:
-        config["geo_input_path"] = Path(args.geo_input)
+        overrides["geo_input_path"] = Path(args.geo_input)
 
     if args.data_input:
-        config["data_input_path"] = Path(args.data_input)
+        overrides["data_input_path"] = Path(args.data_input)
 
     if args.output:
-        config["output_path"] = Path(args.output)
+        overrides["output_path"] = Path(args.output)
 
     if args.max_level is not None:
-        config["max_characteristic_level"] = args.max_level
+        overrides["max_characteristic_level"] = args.max_level
+
+    if args.use_cache:
+        overrides["use_cache"] = True
 
     # Run the pipeline
-    pipeline = CensusPipeline(config)
+    pipeline = CensusPipeline(ChainMap(overrides, CENSUS_CONFIG))
     pipeline.run()
 
 
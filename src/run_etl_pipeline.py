@@ -3,15 +3,13 @@
 
 import argparse
 import sys
+from collections import ChainMap
 from pathlib import Path
 
 # Add the project root to Python path to enable absolute imports
 project_root = Path(__file__).parents[1].absolute()
 sys.path.append(str(project_root))
 
-from src.config.etl_config import AUTO_THEFT_CONFIG  # noqa: E402
-from src.etl.auto_theft_pipeline import AutoTheftPipeline  # noqa: E402
-
 
 def main():
     """Main entry point for the CLI interface."""
@@ -25,6 +23,11 @@ def main():
     parser.add_argument(
         "--output", help="Path for output Parquet file (overrides config)", default=None
     )
+    parser.add_argument(
+        "--use-cache",
+        action="store_true",
+        help="Reuse a cached parquet copy of the raw data if it is up to date",
+    )
     parser.add_argument(
         "--log-level",
         choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
@@ -34,17 +37,25 @@ def main():
 
     args = parser.parse_args()
 
-    # Create custom config with any overridden paths
-    config = AUTO_THEFT_CONFIG.copy()
+    # Import the pipeline only after parsing, so --help skips loading its
+    # data libraries
+    from src.config.etl_config import AUTO_THEFT_CONFIG
+    from src.etl.auto_theft_pipeline import AutoTheftPipeline
+
+    # Layer the command line overrides over the default config
+    overrides = {}
 
     if args.input:
-        config["input_path"] = Path(args.input)
+        overrides["input_path"] = Path(args.input)
 
     if args.output:
-        config["output_path"] = Path(args.output)
+        overrides["output_path"] = Path(args.output)
+
+    if args.use_cache:
+        overrides["use_cache"] = True
 
     # Run the pipeline
-    pipeline = AutoTheftPipeline(config)
+    pipeline = AutoTheftPipeline(ChainMap(overrides, AUTO_THEFT_CONFIG))
     pipeline.run()
 
 
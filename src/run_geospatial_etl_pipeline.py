@@ -3,15 +3,13 @@
 
 import argparse
 import sys
+from collections import ChainMap
 from pathlib import Path
 
 # Add the project root to Python path to enable absolute imports
 project_root = Path(__file__).parents[1].absolute()
 sys.path.append(str(project_root))
 
-from src.config.etl_config import GEOSPATIAL_CONFIG  # noqa: E402
-from src.etl.geospatial_pipeline import GeospatialPipeline  # noqa: E402
-
 
 def main():
     """Main entry point for the CLI interface."""
@@ -52,26 +50,31 @@ def main():
 
     args = parser.parse_args()
 
-    # Create custom config with any overridden paths
-    config = GEOSPATIAL_CONFIG.copy()
+    # Import the pipeline only after parsing, so --help skips loading its
+    # data libraries
+    from src.config.etl_config import GEOSPATIAL_CONFIG
+    from src.etl.geospatial_pipeline import GeospatialPipeline
+
+    # Layer the command line overrides over the default config
+    overrides = {}
 
     if args.hood_input:
-        config["hood_input_path"] = Path(args.hood_input)
+        overrides["hood_input_path"] = Path(args.hood_input)
 
     if args.fsa_input:
-        config["fsa_input_path"] = Path(args.fsa_input)
+        overrides["fsa_input_path"] = Path(args.fsa_input)
 
     if args.output:
-        config["output_path"] = Path(args.output)
+        overrides["output_path"] = Path(args.output)
 
     if args.crs:
-        config["crs"] = args.crs
+        overrides["crs"] = args.crs
 
     if args.min_overlap:
-        config["min_overlap_percent"] = args.min_overlap
+        overrides["min_overlap_percent"] = args.min_overlap
 
     # Run the pipeline
-    pipeline = GeospatialPipeline(config)
+    pipeline = GeospatialPipeline(ChainMap(overrides, GEOSPATIAL_CONFIG))
     pipeline.run()
 
 
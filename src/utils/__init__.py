@@ -5,6 +5,8 @@ various components of the Toronto Auto Theft Analysis project.
 
 Modules:
     validation: Data validation functions
+    parquet_cache: Side-car parquet caching of extracted raw data
+    arrow_utils: Conversions between pandas and Arrow data types
     error_handling: Error handling decorators and utilities
     etl_metrics: Metrics tracking and reporting utilities
 """
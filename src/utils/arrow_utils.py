@@ -0,0 +1,140 @@
+"""Utility functions for converting between pandas and Arrow data types."""
+
+from collections.abc import Callable, Mapping
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from src.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# String columns with fewer distinct values than this, or than half of the
+# rows when that is more, are stored as categories
+MAX_CATEGORIES = 1000
+MAX_DISTINCT_RATIO = 0.5
+# Rows sampled to rule out high-cardinality columns without a full scan
+CARDINALITY_SAMPLE_ROWS = 10_000
+
+
+def arrow_type_from(dtype: str) -> pa.DataType:
+    """Map a pandas dtype name from the ETL config to an Arrow data type.
+
+    Args:
+        dtype: Pandas dtype name (e.g. "Int16", "float32", "category", "object")
+
+    Returns:
+        Equivalent Arrow data type, dictionary-encoded for categories
+    """
+    if dtype == "category":
+        return pa.dictionary(pa.int32(), pa.string())
+    if dtype == "object":
+        return pa.string()
+
+    pandas_dtype = pd.api.types.pandas_dtype(dtype)
+    return pa.from_numpy_dtype(getattr(pandas_dtype, "numpy_dtype", pandas_dtype))
+
+
+def arrow_schema_from(column_dtypes: Mapping[str, str]) -> dict[str, pa.DataType]:
+    """Map a {column: pandas dtype name} dictionary to Arrow column types.
+
+    Args:
+        column_dtypes: Dictionary of column names to pandas dtype names
+
+    Returns:
+        Dictionary of column names to Arrow data types
+    """
+    return {col: arrow_type_from(dtype) for col, dtype in column_dtypes.items()}
+
+
+def pandas_types_mapper(
+    column_dtypes: Mapping[str, str],
+) -> Callable[[pa.DataType], pd.api.extensions.ExtensionDtype | None]:
+    """Build a `types_mapper` restoring the nullable pandas dtypes of a config.
+
+    Arrow integer columns with nulls would otherwise be converted to float64.
+
+    Args:
+        column_dtypes: Dictionary of column names to pandas dtype names
+
+    Returns:
+        Callable mapping Arrow types to pandas extension dtypes, or None
+    """
+    mapping = {}
+    for dtype in column_dtypes.values():
+        pandas_dtype = pd.api.types.pandas_dtype(dtype)
+        is_extension = isinstance(pandas_dtype, pd.api.extensions.ExtensionDtype)
+        if is_extension and pandas_dtype.kind in "iu":
+            mapping[pa.from_numpy_dtype(pandas_dtype.numpy_dtype)] = pandas_dtype
+
+    return mapping.get
+
+
+def table_to_pandas(table: pa.Table, column_dtypes: Mapping[str, str]) -> pd.DataFrame:
+    """Convert an Arrow table to pandas, releasing Arrow buffers as it goes.
+
+    The table must not be used after this call.
+
+    Args:
+        table: Arrow table to convert
+        column_dtypes: Dictionary of column names to pandas dtype names
+
+    Returns:
+        DataFrame with the dtypes declared in column_dtypes
+    """
+    return table.to_pandas(
+        types_mapper=pandas_types_mapper(column_dtypes),
+        self_destruct=True,
+        split_blocks=True,
+    )
+
+
+def encode_categories(values: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Dictionary-encode values with sorted categories, like pandas does.
+
+    All chunks share a single dictionary, which excludes nulls.
+
+    Args:
+        values: Values to encode
+
+    Returns:
+        Dictionary-encoded values, converted to sorted pandas categories
+    """
+    dictionary = pc.unique(values).drop_null().sort()
+    indices = pc.index_in(values, value_set=dictionary)
+    return pa.chunked_array(
+        [pa.DictionaryArray.from_arrays(chunk, dictionary) for chunk in indices.chunks],
+        type=pa.dictionary(pa.int32(), dictionary.type),
+    )
+
+
+def optimize_for_parquet(table: pa.Table) -> pa.Table:
+    """Dictionary-encode the low-cardinality string columns of a table.
+
+    Args:
+        table: Arrow table to optimize for parquet storage
+
+    Returns:
+        Arrow table with low-cardinality string columns as categories
+    """
+    max_categories = max(MAX_CATEGORIES, table.num_rows * MAX_DISTINCT_RATIO)
+
+    # Categorical columns are already dictionary-encoded
+    for i, field in enumerate(table.schema):
+        if not pa.types.is_string(field.type):
+            continue
+
+        # Skip the full scan when a full-size head is already too diverse
+        head = table[i].slice(0, CARDINALITY_SAMPLE_ROWS)
+        if (
+            len(head) == CARDINALITY_SAMPLE_ROWS
+            and pc.count_distinct(head).as_py() >= len(head) * MAX_DISTINCT_RATIO
+        ):
+            continue
+
+        if pc.count_distinct(table[i]).as_py() < max_categories:
+            table = table.set_column(i, field.name, encode_categories(table[i]))
+            logger.debug("Converted column '%s' to category type", field.name)
+
+    return table
@@ -35,23 +35,24 @@ def retry(
     Returns:
         Decorated function with retry logic
     """
+    # Delay before each retry, computed once for every call of the function
+    delays = tuple(delay * backoff**i for i in range(tries - 1))
 
     def decorator(func: F) -> F:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            mtries, mdelay = tries, delay
-
-            while mtries > 1:
+            for attempt, mdelay in enumerate(delays):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
                     logger.warning(
-                        f"Exception {e} occurred, retrying in {mdelay} seconds... "
-                        f"({mtries-1} attempts remaining)"
+                        "Exception %s occurred, retrying in %s seconds... "
+                        "(%d attempts remaining)",
+                        e,
+                        mdelay,
+                        tries - 1 - attempt,
                     )
                     time.sleep(mdelay)
-                    mtries -= 1
-                    mdelay *= backoff
 
             # Last try
             return func(*args, **kwargs)
@@ -77,7 +78,7 @@ def handle_missing_file(default_value: T) -> Callable[[F], Callable[..., T]]:
             try:
                 return func(*args, **kwargs)
             except FileNotFoundError as e:
-                logger.error(f"File not found: {e}")
+                logger.error("File not found: %s", e)
                 return default_value
 
         return wrapper
@@ -1,5 +1,6 @@
 """Utilities for ETL pipeline metrics and monitoring."""
 
+import functools
 import json
 import os
 import time
@@ -7,11 +8,29 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import pandas as pd
+import pyarrow as pa
+
 from src.config.logging_config import get_logger
+from src.config.paths import ROOT_DIR
 
 logger = get_logger(__name__)
 
 
+@functools.cache
+def _metrics_dir(output_dir: Path) -> Path:
+    """Create a metrics output directory, only once per process.
+
+    Args:
+        output_dir: Directory to save metrics JSON files to
+
+    Returns:
+        The created output directory
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir
+
+
 class ETLMetrics:
     """Class for collecting and reporting ETL process metrics.
 
@@ -20,6 +39,14 @@ class ETLMetrics:
     save the metrics to a JSON file.
     """
 
+    __slots__ = (
+        "pipeline_name",
+        "start_time_ns",
+        "stage_starts_ns",
+        "metrics",
+        "output_dir",
+    )
+
     def __init__(self, pipeline_name: str, output_dir: Path | None = None):
         """Initialize the metrics collector.
 
@@ -28,7 +55,8 @@ class ETLMetrics:
             output_dir: Directory to save metrics JSON file (default: logs directory)
         """
         self.pipeline_name = pipeline_name
-        self.start_time = time.time()
+        self.start_time_ns = time.perf_counter_ns()
+        self.stage_starts_ns: dict[str, int] = {}
         self.metrics: dict[str, Any] = {
             "pipeline_name": pipeline_name,
             "start_time": datetime.now().isoformat(),
@@ -39,17 +67,19 @@ class ETLMetrics:
         }
 
         # Set up output directory
-        root_dir = Path(__file__).parents[2].absolute()
-        self.output_dir = output_dir if output_dir else (root_dir / "logs")
-        os.makedirs(self.output_dir, exist_ok=True)
+        self.output_dir = _metrics_dir(Path(output_dir or ROOT_DIR / "logs"))
 
     def start_stage(self, stage_name: str) -> None:
         """Mark the start of a pipeline stage for timing.
 
+        The start is recorded as a wall-clock timestamp, while the duration is
+        timed with the monotonic performance counter.
+
         Args:
             stage_name: Name of the stage starting
         """
         self.metrics["timings"][f"{stage_name}_start"] = time.time()
+        self.stage_starts_ns[stage_name] = time.perf_counter_ns()
 
     def end_stage(self, stage_name: str) -> float:
         """Mark the end of a pipeline stage and calculate duration.
@@ -60,9 +90,9 @@ class ETLMetrics:
         Returns:
             Duration of the stage in seconds
         """
-        end_time = time.time()
-        start_time = self.metrics["timings"].get(f"{stage_name}_start", self.start_time)
-        duration = end_time - start_time
+        end_time_ns = time.perf_counter_ns()
+        start_time_ns = self.stage_starts_ns.get(stage_name, self.start_time_ns)
+        duration = (end_time_ns - start_time_ns) / 1e9
         self.metrics["timings"][f"{stage_name}_duration"] = duration
         return duration
 
@@ -93,14 +123,23 @@ class ETLMetrics:
         """
         self.metrics["validation"]["warnings"][check_name] = count
 
-    def record_memory_usage(self, stage_name: str, df_size_mb: float) -> None:
-        """Record memory usage of a DataFrame.
+    def record_memory_usage(
+        self, stage_name: str, data: pd.DataFrame | pa.Table, deep: bool = False
+    ) -> None:
+        """Record memory usage of a DataFrame or Arrow table in MB.
 
         Args:
             stage_name: Name of the stage
-            df_size_mb: Size of DataFrame in MB
+            data: DataFrame or Arrow table to measure
+            deep: Whether to include the size of Python objects referenced by
+                DataFrame object columns, which requires a full pass over their
+                values. Arrow tables are always measured exactly.
         """
-        self.metrics["memory_usage"][stage_name] = df_size_mb
+        if isinstance(data, pa.Table):
+            size = data.nbytes
+        else:
+            size = data.memory_usage(deep=deep).sum()
+        self.metrics["memory_usage"][stage_name] = size / 1e6
 
     def finalize(self) -> dict[str, Any]:
         """Finalize metrics collection and calculate summary statistics.
@@ -108,9 +147,9 @@ class ETLMetrics:
         Returns:
             Complete metrics dictionary
         """
-        end_time = time.time()
+        end_time_ns = time.perf_counter_ns()
         self.metrics["end_time"] = datetime.now().isoformat()
-        self.metrics["total_duration"] = end_time - self.start_time
+        self.metrics["total_duration"] = (end_time_ns - self.start_time_ns) / 1e9
 
         # Calculate additional metrics
         if (
@@ -149,11 +188,14 @@ class ETLMetrics:
         filename = f"{self.pipeline_name}_metrics_{timestamp}{suffix_str}.json"
         filepath = self.output_dir / filename
 
-        # Write to file
-        with open(filepath, "w") as f:
-            json.dump(self.metrics, f, indent=2)
+        # Encode compactly in memory, which uses the C encoder, and write the
+        # file in a single call, replacing it atomically so readers never see
+        # a partially written file
+        tmp_path = filepath.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(self.metrics))
+        os.replace(tmp_path, filepath)
 
-        logger.info(f"Saved ETL metrics to {filepath}")
+        logger.info("Saved ETL metrics to %s", filepath)
         return str(filepath)
 
     def summary(self) -> str:
@@ -0,0 +1,122 @@
+"""Utilities for caching extracted raw data as side-car Parquet files."""
+
+import contextlib
+import hashlib
+import json
+import os
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def cache_paths(source_path: Path) -> tuple[Path, Path]:
+    """Get the cache and stamp file paths for a raw source file.
+
+    Args:
+        source_path: Path to the raw source file
+
+    Returns:
+        Tuple of (cache_path, stamp_path)
+    """
+    cache_path = Path(source_path).with_suffix(".cached.parquet")
+    return cache_path, cache_path.with_suffix(".stamp")
+
+
+def _canonical(value: Any) -> Any:
+    """Convert a configuration value to a JSON-serializable canonical form.
+
+    Args:
+        value: Configuration value, possibly nested in mappings and collections
+
+    Returns:
+        Equivalent value that serializes the same way in every process
+    """
+    if isinstance(value, Mapping):
+        return {str(key): _canonical(item) for key, item in value.items()}
+    if isinstance(value, set | frozenset):
+        return sorted(repr(item) for item in value)
+    if isinstance(value, list | tuple):
+        return [_canonical(item) for item in value]
+    return repr(value)
+
+
+def source_stamp(*source_paths: Path, settings: Mapping[str, Any] | None = None) -> str:
+    """Build a freshness stamp from the sources and the settings applied to them.
+
+    Args:
+        source_paths: Paths of the raw files the cached data is derived from
+        settings: Extraction settings the cached data depends on, so that a
+            change to them invalidates the cache as well
+
+    Returns:
+        Stamp string identifying the current state of the source files
+    """
+    stats = (os.stat(path) for path in source_paths)
+    stamp = ";".join(f"{st.st_mtime_ns}:{st.st_size}" for st in stats)
+
+    if settings:
+        encoded = json.dumps(_canonical(settings), sort_keys=True).encode()
+        stamp += f";{hashlib.sha256(encoded).hexdigest()}"
+
+    return stamp
+
+
+def read_cache(cache_path: Path, stamp_path: Path, stamp: str) -> pa.Table | None:
+    """Read a cached table if it exists and matches the current stamp.
+
+    Args:
+        cache_path: Path to the cached parquet file
+        stamp_path: Path to the stamp file written alongside the cache
+        stamp: Current stamp of the source files
+
+    Returns:
+        Cached Arrow table, or None if the cache is missing, stale or unreadable
+    """
+    if not (cache_path.exists() and stamp_path.exists()):
+        return None
+
+    try:
+        if stamp_path.read_text() != stamp:
+            logger.info("Cache %s is stale, re-reading source data", cache_path)
+            return None
+
+        logger.info("Reading cached data from %s", cache_path)
+        return pq.read_table(cache_path)
+    except (pa.ArrowInvalid, OSError) as e:
+        logger.warning(
+            "Could not read cache %s, re-reading source data: %s", cache_path, e
+        )
+        return None
+
+
+def write_cache(
+    table: pa.Table, cache_path: Path, stamp_path: Path, stamp: str
+) -> None:
+    """Persist a table to the cache atomically and record its stamp.
+
+    Failures are logged and swallowed, since the cache is only an optimization.
+
+    Args:
+        table: Arrow table to cache
+        cache_path: Path to the cached parquet file
+        stamp_path: Path to the stamp file written alongside the cache
+        stamp: Current stamp of the source files
+    """
+    tmp_path = cache_path.with_suffix(".tmp")
+
+    try:
+        pq.write_table(table, tmp_path, compression="zstd")
+        os.replace(tmp_path, cache_path)
+        stamp_path.write_text(stamp)
+        logger.info("Cached extracted data to %s", cache_path)
+    except (pa.ArrowException, OSError) as e:
+        logger.warning("Could not write cache %s: %s", cache_path, e)
+        with contextlib.suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
@@ -11,7 +11,7 @@ def validate_coordinates(
     lat_max: float,
     lon_min: float,
     lon_max: float,
-) -> tuple[pd.DataFrame, pd.DataFrame]:
+) -> pd.Series:
     """Validate geographic coordinates are within expected boundaries.
 
     Args:
@@ -24,24 +24,23 @@ def validate_coordinates(
         lon_max: Maximum valid longitude
 
     Returns:
-        Tuple of (valid_df, invalid_df)
+        Boolean mask of the rows with valid coordinates
     """
-    mask = (
-        (df[lat_col] >= lat_min)
-        & (df[lat_col] <= lat_max)
-        & (df[lon_col] >= lon_min)
-        & (df[lon_col] <= lon_max)
-    )
+    # Compare the raw arrays, combining the bounds into a single mask in place
+    lat = df[lat_col].to_numpy()
+    lon = df[lon_col].to_numpy()
 
-    valid_df = df[mask].copy()
-    invalid_df = df[~mask].copy()
+    mask = lat >= lat_min
+    mask &= lat <= lat_max
+    mask &= lon >= lon_min
+    mask &= lon <= lon_max
 
-    return valid_df, invalid_df
+    return pd.Series(mask, index=df.index)
 
 
 def validate_date_logic(
     df: pd.DataFrame, occurrence_date_col: str, report_date_col: str
-) -> tuple[pd.DataFrame, pd.DataFrame]:
+) -> pd.Series:
     """Validate occurrence date is not later than report date.
 
     Args:
@@ -50,19 +49,17 @@ def validate_date_logic(
         report_date_col: Name of report date column
 
     Returns:
-        Tuple of (valid_df, invalid_df)
+        Boolean mask of the rows with valid dates
     """
-    mask = df[occurrence_date_col] <= df[report_date_col]
+    occurrence_dates = df[occurrence_date_col].to_numpy()
+    report_dates = df[report_date_col].to_numpy()
 
-    valid_df = df[mask].copy()
-    invalid_df = df[~mask].copy()
-
-    return valid_df, invalid_df
+    return pd.Series(occurrence_dates <= report_dates, index=df.index)
 
 
 def validate_date_range(
     df: pd.DataFrame, date_col: str, min_date: str, max_date: str | None = None
-) -> tuple[pd.DataFrame, pd.DataFrame]:
+) -> pd.Series:
     """Validate dates are within expected range.
 
     Args:
@@ -72,17 +69,15 @@ def validate_date_range(
         max_date: Maximum valid date as string (YYYY-MM-DD), defaults to current date
 
     Returns:
-        Tuple of (valid_df, invalid_df)
+        Boolean mask of the rows with dates in range
     """
-    mask = df[date_col] >= pd.Timestamp(min_date)
+    dates = df[date_col].to_numpy()
+    mask = dates >= pd.Timestamp(min_date).to_datetime64()
 
     if max_date:
-        mask = mask & (df[date_col] <= pd.Timestamp(max_date))
-
-    valid_df = df[mask].copy()
-    invalid_df = df[~mask].copy()
+        mask &= dates <= pd.Timestamp(max_date).to_datetime64()
 
-    return valid_df, invalid_df
+    return pd.Series(mask, index=df.index)
 
 
 def check_missing_data(
@@ -98,15 +93,5 @@ def check_missing_data(
     Returns:
         Dictionary of {column_name: missing_percentage} for columns exceeding threshold
     """
-    exclude_cols = exclude_cols or []
-    result = {}
-
-    for col in df.columns:
-        if col in exclude_cols:
-            continue
-
-        missing_pct = df[col].isna().mean()
-        if missing_pct > threshold:
-            result[col] = missing_pct
-
-    return result
+    missing_pct = df.isna().mean().drop(exclude_cols or [], errors="ignore")
+    return missing_pct[missing_pct > threshold].to_dict()
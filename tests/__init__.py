@@ -0,0 +1 @@
+"""Tests for the Toronto Auto Theft Analysis ETL pipelines."""
@@ -0,0 +1,44 @@
+"""Tests for the pandas and Arrow conversion helpers."""
+
+import pyarrow as pa
+
+from src.utils.arrow_utils import encode_categories, optimize_for_parquet
+
+
+def test_encode_categories_sorts_and_drops_nulls():
+    """Categories are sorted and shared by all chunks, without nulls."""
+    values = pa.chunked_array([["b", None], ["a", "b"]])
+
+    encoded = encode_categories(values)
+
+    assert encoded.type == pa.dictionary(pa.int32(), pa.string())
+    assert all(chunk.dictionary.to_pylist() == ["a", "b"] for chunk in encoded.chunks)
+    assert encoded.to_pylist() == ["b", None, "a", "b"]
+
+
+def test_optimize_for_parquet_encodes_low_cardinality_strings():
+    """Only string columns with few distinct values become categories."""
+    num_rows = 30_000
+    table = pa.table(
+        {
+            "id": [f"GO-{i}" for i in range(num_rows)],
+            "hood": [str(i % 158) for i in range(num_rows)],
+            "year": [2020 + i % 5 for i in range(num_rows)],
+        }
+    )
+
+    optimized = optimize_for_parquet(table)
+
+    assert optimized.schema.field("id").type == pa.string()
+    assert optimized.schema.field("hood").type == pa.dictionary(pa.int32(), pa.string())
+    assert optimized.schema.field("year").type == pa.int64()
+    assert optimized["hood"].to_pylist() == table["hood"].to_pylist()
+
+
+def test_optimize_for_parquet_small_table_uses_full_scan():
+    """Small tables are judged on all their rows against the category limit."""
+    table = pa.table({"name": [f"Hood {i % 600}" for i in range(1200)]})
+
+    optimized = optimize_for_parquet(table)
+
+    assert pa.types.is_dictionary(optimized.schema.field("name").type)
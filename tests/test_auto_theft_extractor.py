@@ -0,0 +1,39 @@
+"""Tests for the auto theft CSV extractor."""
+
+from src.config.etl_config import AUTO_THEFT_CONFIG
+from src.etl.extractors.auto_theft_extractor import AutoTheftExtractor
+
+HEADER = (
+    "EVENT_UNIQUE_ID,REPORT_DATE,OCC_DATE,REPORT_MONTH,REPORT_DOW,OCC_MONTH,"
+    "OCC_DOW,DIVISION,LOCATION_TYPE,PREMISES_TYPE,HOOD_158,NEIGHBOURHOOD_158"
+)
+ROWS = (
+    "GO-1,2023-09-03,2023-09-03,September,Sunday   ,September,Sunday   ,"
+    "D14,Street,Outside,14,Hood 14 (14)",
+    "GO-2,2023-02-01,2023-02-01,February,Wednesday,February,Wednesday,"
+    "NSA,Driveway,House,NSA,NSA",
+    "GO-3,2023-04-10,2023-04-10,April,Monday   ,April,Monday   ,"
+    "D11,Parking Lot,Commercial,1,Hood 1 (1)",
+)
+
+
+def test_categories_are_sorted(tmp_path):
+    """Categorical columns get sorted categories without the NA markers."""
+    source = tmp_path / "auto_theft.csv"
+    source.write_text("\n".join((HEADER, *ROWS)) + "\n")
+    config = {**AUTO_THEFT_CONFIG, "input_path": source, "use_cache": False}
+
+    table = AutoTheftExtractor(config).extract_data()
+
+    assert table["REPORT_MONTH"].combine_chunks().dictionary.to_pylist() == [
+        "April",
+        "February",
+        "September",
+    ]
+    assert table["OCC_DOW"].combine_chunks().dictionary.to_pylist() == [
+        "Monday",
+        "Sunday",
+        "Wednesday",
+    ]
+    assert table["DIVISION"].combine_chunks().dictionary.to_pylist() == ["D11", "D14"]
+    assert table["DIVISION"].null_count == 1
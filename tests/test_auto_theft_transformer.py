@@ -0,0 +1,30 @@
+"""Tests for the auto theft transformer."""
+
+import pandas as pd
+
+from src.etl.transformers.auto_theft_transformer import AutoTheftTransformer
+
+
+def test_missing_hoods_are_imputed_from_division():
+    """Rows with an NSA hood get the modal hood and name of their division."""
+    df = pd.DataFrame(
+        {
+            "DIVISION": ["D11", "D11", "D11", "D14", "D11", "D14"],
+            "HOOD_158": ["1", "1", "2", "14", None, None],
+            "NEIGHBOURHOOD_158": [
+                "Hood 1 (1)",
+                "Hood 1 (1)",
+                "Hood 2 (2)",
+                "Hood 14 (14)",
+                None,
+                None,
+            ],
+        },
+        dtype="category",
+    )
+
+    result = AutoTheftTransformer()._impute_missing_hood_with_division(df)
+
+    assert result["HOOD_158"].tolist()[4:] == ["1", "14"]
+    assert result["NEIGHBOURHOOD_158"].tolist()[4:] == ["Hood 1 (1)", "Hood 14 (14)"]
+    assert result["HOOD_158"].cat.categories.tolist() == ["1", "14", "2"]
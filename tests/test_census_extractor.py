@@ -0,0 +1,81 @@
+"""Tests for the census CSV extractor."""
+
+import pyarrow as pa
+import pytest
+
+from src.config.etl_config import CENSUS_CONFIG
+from src.etl.extractors import census_extractor
+from src.etl.extractors.census_extractor import CensusExtractor
+
+HEADER = (
+    "CENSUS_YEAR,DGUID,ALT_GEO_CODE,GEO_LEVEL,GEO_NAME,TNR_SF,TNR_LF,"
+    "DATA_QUALITY_FLAG,CHARACTERISTIC_ID,CHARACTERISTIC_NAME,CHARACTERISTIC_NOTE,"
+    "C1_COUNT_TOTAL,SYMBOL"
+)
+
+
+def census_row(fsa: str, characteristic_id: int, count: str = "100") -> str:
+    """Build a census data row for an FSA and characteristic."""
+    return (
+        f"2021,2021A0011{fsa},{fsa},FSA,{fsa},4.5,3.2,0,{characteristic_id},"
+        f"Characteristic {characteristic_id},,{count},"
+    )
+
+
+def read_census(tmp_path, rows: list[str]) -> pa.Table:
+    """Stream a census file with the given data rows."""
+    source = tmp_path / "census.csv"
+    source.write_text("\n".join((HEADER, *rows)) + "\n", encoding="latin1")
+    config = {**CENSUS_CONFIG, "data_input_path": source}
+
+    return CensusExtractor(config).extract_census_data(0, len(rows))
+
+
+def extract(tmp_path, fsas: list[str]) -> list[str]:
+    """Stream a census file with one row per FSA and return the Toronto FSAs."""
+    rows = [census_row(fsa, i) for i, fsa in enumerate(fsas, start=1)]
+    return read_census(tmp_path, rows)["ALT_GEO_CODE"].to_pylist()
+
+
+@pytest.fixture(params=[256, 400, 600])
+def small_blocks(request, monkeypatch):
+    """Stream the census file in blocks of a few rows each."""
+    monkeypatch.setattr(census_extractor, "CSV_BLOCK_SIZE", request.param)
+
+
+@pytest.mark.usefixtures("small_blocks")
+def test_group_spanning_batches_is_read_whole(tmp_path):
+    """A batch boundary inside the FSA group doesn't end the stream."""
+    toronto = [f"M{i}A" for i in range(10)]
+    fsas = ["L0A"] * 5 + toronto + ["N0A"] * 5
+
+    assert extract(tmp_path, fsas) == toronto
+
+
+@pytest.mark.usefixtures("small_blocks")
+def test_stream_stops_after_group(tmp_path):
+    """Rows in batches after the end of the FSA group are not read."""
+    toronto = [f"M{i}A" for i in range(10)]
+    fsas = ["L0A"] * 5 + toronto + ["N0A"] * 10 + ["M9Z"]
+
+    assert extract(tmp_path, fsas) == toronto
+
+
+def test_geo_codes_are_stripped(tmp_path):
+    """Padded geographic codes are stripped before they are matched."""
+    fsas = ["L0A", " M1A", "M2A  ", "N0A"]
+
+    assert extract(tmp_path, fsas) == ["M1A", "M2A"]
+
+
+@pytest.mark.usefixtures("small_blocks")
+@pytest.mark.parametrize("first_count", ["100", ""])
+def test_data_columns_typed_beyond_first_block(tmp_path, first_count):
+    """Decimals after integer-only or empty blocks are read as floats."""
+    counts = [first_count] * 10 + ["12.5"]
+    rows = [census_row(f"M{i}A", i, count) for i, count in enumerate(counts)]
+
+    table = read_census(tmp_path, rows)
+
+    assert table.schema.field("C1_COUNT_TOTAL").type == pa.float64()
+    assert table["C1_COUNT_TOTAL"].to_pylist()[-1] == 12.5
@@ -0,0 +1,70 @@
+"""Tests for the side-car parquet cache of extracted raw data."""
+
+import pyarrow as pa
+
+from src.utils.parquet_cache import cache_paths, read_cache, source_stamp, write_cache
+
+
+def test_cache_round_trip(tmp_path):
+    """A cached table is returned while the source and settings are unchanged."""
+    source = tmp_path / "data.csv"
+    source.write_text("a\n1\n")
+    cache_path, stamp_path = cache_paths(source)
+    table = pa.table({"a": [1]})
+
+    stamp = source_stamp(source, settings={"columns_to_drop": ("b",)})
+    write_cache(table, cache_path, stamp_path, stamp)
+
+    assert read_cache(cache_path, stamp_path, stamp).equals(table)
+
+
+def test_settings_change_invalidates_cache(tmp_path):
+    """A change to the extraction settings makes the cache stale."""
+    source = tmp_path / "data.csv"
+    source.write_text("a\n1\n")
+    cache_path, stamp_path = cache_paths(source)
+
+    stamp = source_stamp(source, settings={"na_values": {"a": (0, "0")}})
+    write_cache(pa.table({"a": [1]}), cache_path, stamp_path, stamp)
+
+    new_stamp = source_stamp(source, settings={"na_values": {"a": ("0",)}})
+    assert new_stamp != stamp
+    assert read_cache(cache_path, stamp_path, new_stamp) is None
+
+
+def test_settings_stamp_ignores_set_order(tmp_path):
+    """Equal settings give the same stamp regardless of set iteration order."""
+    source = tmp_path / "data.csv"
+    source.write_text("a\n1\n")
+
+    first = source_stamp(source, settings={"days": frozenset({"Sat", "Sun"})})
+    second = source_stamp(source, settings={"days": frozenset({"Sun", "Sat"})})
+
+    assert first == second
+
+
+def test_corrupt_cache_is_ignored(tmp_path):
+    """An unreadable cache file falls back to the source data."""
+    source = tmp_path / "data.csv"
+    source.write_text("a\n1\n")
+    cache_path, stamp_path = cache_paths(source)
+
+    stamp = source_stamp(source)
+    cache_path.write_bytes(b"not parquet")
+    stamp_path.write_text(stamp)
+
+    assert read_cache(cache_path, stamp_path, stamp) is None
+
+
+def test_failed_cache_write_is_swallowed(tmp_path):
+    """A table that can't be written to parquet leaves no cache behind."""
+    source = tmp_path / "data.csv"
+    source.write_text("a\n1\n")
+    cache_path, stamp_path = cache_paths(source)
+    table = pa.table({"a": pa.array([None], type=pa.null())}).cast(
+        pa.schema([("a", pa.month_day_nano_interval())])
+    )
+
+    write_cache(table, cache_path, stamp_path, source_stamp(source))
+
+    assert list(tmp_path.iterdir()) == [source]